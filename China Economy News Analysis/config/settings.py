@@ -25,13 +25,18 @@ LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
 CLAUDE_MODEL = os.getenv("CLAUDE_MODEL", "claude-sonnet-4-20250514")
 MAX_TOKENS = int(os.getenv("MAX_TOKENS", "4096"))
+CLAUDE_MAX_CONCURRENCY = int(os.getenv("CLAUDE_MAX_CONCURRENCY", "8"))
+CLAUDE_REQUESTS_PER_MINUTE = int(os.getenv("CLAUDE_REQUESTS_PER_MINUTE", "50"))
 
 # Crawler
 CRAWL_INTERVAL_HOURS = int(os.getenv("CRAWL_INTERVAL_HOURS", "1"))
 MAX_NEWS_PER_SOURCE = int(os.getenv("MAX_NEWS_PER_SOURCE", "20"))
+CRAWL_MAX_CONCURRENCY = int(os.getenv("CRAWL_MAX_CONCURRENCY", "8"))
 
 # Request settings
-REQUEST_TIMEOUT = 30
+REQUEST_TIMEOUT = 30          # read timeout (seconds)
+REQUEST_CONNECT_TIMEOUT = 5   # TCP/TLS connect timeout (seconds)
+REQUEST_RETRIES = 2           # retries on connection errors / 5xx
 REQUEST_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -19,7 +19,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def get_eligible_candidates(conn) -> list:
+def get_eligible_candidates(conn, now: datetime = None) -> list:
     """Fetch all eligible news candidates for selection.
 
     Strict 24-hour freshness filter: only news with an explicit published_at
@@ -29,7 +29,7 @@ def get_eligible_candidates(conn) -> list:
     cursor = conn.cursor()
 
     # Strict 24-hour cutoff — no exceptions
-    cutoff_time = datetime.now() - timedelta(hours=24)
+    cutoff_time = (now or datetime.now()) - timedelta(hours=24)
     cutoff_str = cutoff_time.strftime("%Y-%m-%d %H:%M:%S")
 
     # Central government sources excluded from expert review
@@ -50,8 +50,10 @@ def get_eligible_candidates(conn) -> list:
         ORDER BY published_at DESC
     """, (cutoff_str, *excluded_sources))
 
+    # Stream rows from the cursor; filter_news mutates the dicts, so rows
+    # are still copied into plain dicts (sqlite3.Row is read-only).
     candidates = []
-    for row in cursor.fetchall():
+    for row in cursor:
         # Double-check: enforce 24h cutoff in Python
         if row['published_at'] < cutoff_str:
             continue
@@ -60,13 +62,14 @@ def get_eligible_candidates(conn) -> list:
             'original_title': row['original_title'] or '',
             'original_content': row['original_content'] or '',
             'published_at': row['published_at'],
-            'source': row['source'] or '',
+            # Interned: source is a dict key in balance_categories' per-source counts
+            'source': sys.intern(row['source'] or ''),
         })
 
     return candidates
 
 
-def select_daily_news(target_count: int = 10) -> list:
+def select_daily_news(target_count: int = 10, now: datetime = None) -> list:
     """Select exactly target_count news items for daily expert review.
 
     Uses the canonical filter_news() and balance_categories() from
@@ -78,7 +81,7 @@ def select_daily_news(target_count: int = 10) -> list:
     conn = get_connection()
 
     try:
-        candidates = get_eligible_candidates(conn)
+        candidates = get_eligible_candidates(conn, now)
 
         if not candidates:
             logger.warning("No eligible candidates found for daily selection")
@@ -95,11 +98,14 @@ def select_daily_news(target_count: int = 10) -> list:
 
         # Log selection summary
         if selected:
-            from collections import Counter
-            categories = Counter(n.get('category', '기타') for n in selected)
-            sources = Counter(n.get('source', '') for n in selected)
-            logger.info(f"Category distribution: {dict(categories)}")
-            logger.info(f"Source distribution: {dict(sources)}")
+            categories, sources = {}, {}
+            for n in selected:
+                category = n.get('category', '기타')
+                source = n.get('source', '')
+                categories[category] = categories.get(category, 0) + 1
+                sources[source] = sources.get(source, 0) + 1
+            logger.info(f"Category distribution: {categories}")
+            logger.info(f"Source distribution: {sources}")
 
         return [item['id'] for item in selected]
 
@@ -107,7 +113,7 @@ def select_daily_news(target_count: int = 10) -> list:
         conn.close()
 
 
-def update_selected_status(news_ids: list) -> int:
+def update_selected_status(news_ids: list, now: datetime = None) -> int:
     """Update expert_review_status to 'queued_today' for selected items.
 
     Returns:
@@ -126,7 +132,7 @@ def update_selected_status(news_ids: list) -> int:
             SET expert_review_status = 'queued_today',
                 updated_at = ?
             WHERE id IN ({placeholders})
-        """, [datetime.now()] + news_ids)
+        """, [now or datetime.now()] + news_ids)
 
         conn.commit()
         updated = cursor.rowcount
@@ -137,7 +143,7 @@ def update_selected_status(news_ids: list) -> int:
         conn.close()
 
 
-def reset_previous_queue() -> int:
+def reset_previous_queue(now: datetime = None) -> int:
     """Reset yesterday's 'queued_today' items that weren't reviewed.
 
     Items that were 'queued_today' but not reviewed become 'none' again
@@ -155,7 +161,7 @@ def reset_previous_queue() -> int:
             SET expert_review_status = 'none',
                 updated_at = ?
             WHERE expert_review_status = 'queued_today'
-        """, (datetime.now(),))
+        """, (now or datetime.now(),))
 
         conn.commit()
         reset_count = cursor.rowcount
@@ -181,21 +187,24 @@ def run_daily_selection() -> dict:
     """
     logger.info("Starting daily news selection")
 
+    # One timestamp for the whole run (cutoff, updated_at, summary)
+    now = datetime.now()
+
     # Reset previous queue
-    reset_count = reset_previous_queue()
+    reset_count = reset_previous_queue(now)
 
     # Select new items
-    selected_ids = select_daily_news(target_count=10)
+    selected_ids = select_daily_news(target_count=10, now=now)
 
     # Update status
-    updated_count = update_selected_status(selected_ids)
+    updated_count = update_selected_status(selected_ids, now)
 
     result = {
         "reset_count": reset_count,
         "selected_count": len(selected_ids),
         "updated_count": updated_count,
         "selected_ids": selected_ids,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now.isoformat(),
     }
 
     logger.info(f"Daily selection complete: {result}")
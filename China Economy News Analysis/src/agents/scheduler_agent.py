@@ -10,7 +10,8 @@ This agent runs on a schedule to:
 import logging
 import signal
 import sys
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -32,6 +33,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger("scheduler")
 
+# 예약 작업 동시 실행 수 (수집이 길어져도 백업/요약이 밀리지 않도록)
+JOB_WORKERS = 4
+
 
 class SchedulerAgent:
     """Agent that schedules and runs automated tasks."""
@@ -41,6 +45,15 @@ class SchedulerAgent:
         self.analyzer = None  # Lazy load to avoid API key issues at startup
         self.notification_manager = NotificationManager()
         self.running = True
+        self._stop_event = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="job")
+        self._running_jobs = set()
+        self._jobs_lock = threading.Lock()
+        # Hourly collection and the backup both touch the DB: never run them together,
+        # so the backup snapshot is not taken in the middle of a crawl/analysis batch
+        self._db_job_lock = threading.Lock()
+        # stats is updated from job worker threads
+        self._stats_lock = threading.Lock()
         self.stats = {
             "total_collected": 0,
             "total_analyzed": 0,
@@ -50,6 +63,11 @@ class SchedulerAgent:
             "errors": 0,
         }
 
+    def _add_stat(self, key: str, amount: int = 1):
+        """Increment a counter in self.stats (thread-safe)."""
+        with self._stats_lock:
+            self.stats[key] += amount
+
     def _get_analyzer(self):
         """Lazy load analyzer to handle API key availability."""
         if self.analyzer is None:
@@ -67,7 +85,7 @@ class SchedulerAgent:
 
         try:
             results = self.crawler.crawl_all()
-            self.stats["total_collected"] += results["new"]
+            self._add_stat("total_collected", results["new"])
             self.stats["last_crawl"] = datetime.now()
 
             logger.info(f"Collection complete: {results['total']} total, {results['new']} new")
@@ -81,7 +99,7 @@ class SchedulerAgent:
 
         except Exception as e:
             logger.error(f"Collection failed: {e}")
-            self.stats["errors"] += 1
+            self._add_stat("errors")
             return {"total": 0, "new": 0, "sources": {}}
 
     def analyze_news(self, limit: int = 10) -> list:
@@ -94,7 +112,7 @@ class SchedulerAgent:
 
         try:
             results = analyzer.analyze_unanalyzed(limit=limit)
-            self.stats["total_analyzed"] += len(results)
+            self._add_stat("total_analyzed", len(results))
             self.stats["last_analysis"] = datetime.now()
 
             # Log analysis results and create notifications for high importance
@@ -111,7 +129,7 @@ class SchedulerAgent:
                         importance_score=score,
                         title=title
                     ):
-                        self.stats["total_notifications"] += 1
+                        self._add_stat("total_notifications")
                         logger.info(f"    -> Notification created (high importance)")
 
             logger.info(f"Analysis complete: {len(results)} articles processed")
@@ -119,18 +137,19 @@ class SchedulerAgent:
 
         except Exception as e:
             logger.error(f"Analysis failed: {e}")
-            self.stats["errors"] += 1
+            self._add_stat("errors")
             return []
 
     def run_hourly_task(self):
         """Combined hourly task: collect, enrich, then analyze."""
-        self.collect_news()
+        with self._db_job_lock:
+            self.collect_news()
 
-        # Enrich content for articles missing full text
-        self.enrich_content(limit=5)
+            # Enrich content for articles missing full text
+            self.enrich_content(limit=5)
 
-        # Analyze up to 10 new articles per hour
-        self.analyze_news(limit=10)
+            # Analyze up to 10 new articles per hour
+            self.analyze_news(limit=10)
 
         # Print stats
         self._print_stats()
@@ -144,7 +163,7 @@ class SchedulerAgent:
             logger.info(f"Content enriched: {enriched} articles")
         except Exception as e:
             logger.error(f"Content enrichment failed: {e}")
-            self.stats["errors"] += 1
+            self._add_stat("errors")
 
     def run_daily_backup(self):
         """Run daily database backup (runs at 23:00)."""
@@ -152,7 +171,9 @@ class SchedulerAgent:
         logger.info("Running daily backup...")
 
         try:
-            backup_path = create_backup(compress=True)
+            # Wait for a running hourly task to finish its writes first
+            with self._db_job_lock:
+                backup_path = create_backup(compress=True)
             logger.info(f"Backup created: {backup_path}")
 
             # Cleanup old backups (keep 7 days)
@@ -162,7 +183,7 @@ class SchedulerAgent:
 
         except Exception as e:
             logger.error(f"Backup failed: {e}")
-            self.stats["errors"] += 1
+            self._add_stat("errors")
 
     def run_daily_summary(self):
         """Generate daily summary (runs at midnight)."""
@@ -173,13 +194,15 @@ class SchedulerAgent:
         cursor = conn.cursor()
 
         # Get today's stats
+        # (range on collected_at instead of DATE(collected_at) so idx_news_collected is usable)
         cursor.execute("""
             SELECT
                 COUNT(*) as total,
-                COUNT(CASE WHEN analyzed_at IS NOT NULL THEN 1 END) as analyzed,
+                COALESCE(SUM(analyzed_at IS NOT NULL), 0) as analyzed,
                 AVG(CASE WHEN importance_score > 0 THEN importance_score END) as avg_score
             FROM news
-            WHERE DATE(collected_at) = DATE('now')
+            WHERE collected_at >= DATE('now')
+                AND collected_at < DATE('now', '+1 day')
         """)
         row = cursor.fetchone()
 
@@ -187,7 +210,8 @@ class SchedulerAgent:
         cursor.execute("""
             SELECT translated_title, importance_score, industry_category
             FROM news
-            WHERE DATE(collected_at) = DATE('now')
+            WHERE collected_at >= DATE('now')
+                AND collected_at < DATE('now', '+1 day')
                 AND importance_score IS NOT NULL
             ORDER BY importance_score DESC
             LIMIT 5
@@ -216,18 +240,43 @@ class SchedulerAgent:
         if self.stats['last_crawl']:
             logger.info(f"  - Last crawl: {self.stats['last_crawl'].strftime('%H:%M:%S')}")
 
+    def _submit(self, job_func):
+        """Run a scheduled task on the worker pool.
+
+        A task whose previous run is still in progress is skipped, so overdue
+        runs coalesce into one instead of piling up.
+        """
+        name = job_func.__name__
+        with self._jobs_lock:
+            if name in self._running_jobs:
+                logger.warning(f"{name} is still running, skipping this run")
+                return
+            self._running_jobs.add(name)
+        self._executor.submit(self._run_job, job_func)
+
+    def _run_job(self, job_func):
+        """Worker-side wrapper: log failures and release the task slot."""
+        try:
+            job_func()
+        except Exception as e:
+            logger.error(f"{job_func.__name__} failed: {e}")
+            self._add_stat("errors")
+        finally:
+            with self._jobs_lock:
+                self._running_jobs.discard(job_func.__name__)
+
     def setup_schedule(self):
         """Configure the schedule for all tasks."""
         interval = CRAWL_INTERVAL_HOURS
 
         # Hourly collection and analysis
-        schedule.every(interval).hours.do(self.run_hourly_task)
+        schedule.every(interval).hours.do(self._submit, self.run_hourly_task)
 
         # Daily backup at 23:00
-        schedule.every().day.at("23:00").do(self.run_daily_backup)
+        schedule.every().day.at("23:00").do(self._submit, self.run_daily_backup)
 
         # Daily summary at midnight
-        schedule.every().day.at("00:00").do(self.run_daily_summary)
+        schedule.every().day.at("00:00").do(self._submit, self.run_daily_summary)
 
         logger.info(f"Schedule configured:")
         logger.info(f"  - News collection: every {interval} hour(s)")
@@ -255,16 +304,25 @@ class SchedulerAgent:
 
         # Main loop
         logger.info("Entering scheduler loop (Ctrl+C to stop)...")
-        while self.running:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
-
+        while not self._stop_event.is_set():
+            # Sleep until the next job is due; stop() wakes the wait immediately
+            idle = schedule.idle_seconds()
+            if idle is None:
+                idle = 3600
+            if idle > 0:
+                self._stop_event.wait(timeout=min(idle, 3600))
+            if not self._stop_event.is_set():
+                schedule.run_pending()
+
+        # Let in-flight tasks finish before exiting
+        self._executor.shutdown(wait=True)
         logger.info("Scheduler agent stopped.")
 
     def stop(self):
         """Stop the scheduler agent gracefully."""
         logger.info("Stopping scheduler agent...")
         self.running = False
+        self._stop_event.set()
 
 
 def signal_handler(signum, frame):
@@ -2,6 +2,10 @@
 
 import json
 import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 
@@ -9,45 +13,67 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-from config.settings import ANTHROPIC_API_KEY, CLAUDE_MODEL, MAX_TOKENS
-from src.database.models import get_connection
+from config.settings import (
+    ANTHROPIC_API_KEY,
+    CLAUDE_MODEL,
+    MAX_TOKENS,
+    CLAUDE_MAX_CONCURRENCY,
+    CLAUDE_REQUESTS_PER_MINUTE,
+)
+from src.database.models import pool
+from src.analyzer.embeddings import (
+    UPDATE_TOPIC_VECTOR_SQL,
+    build_embedding_text,
+    generate_embeddings,
+    pack_vector,
+    text_hash,
+)
+
+try:
+    import orjson  # Optional: faster JSON parsing
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import h2  # noqa: F401  Optional: enables HTTP/2 for the Anthropic client
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class ClaudeAnalyzer:
-    """Analyzer using Claude API for translation, summarization, and scoring."""
+class _RequestRateLimiter:
+    """Thread-safe request spacing derived from a requests-per-minute budget."""
 
-    def __init__(self):
-        if not ANTHROPIC_API_KEY:
-            raise ValueError("ANTHROPIC_API_KEY not set")
+    def __init__(self, requests_per_minute: int):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
 
-        import anthropic
-        self.client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
-        self.model = CLAUDE_MODEL
+    def wait(self):
+        """Block until the next request slot opens."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
 
-    def analyze_news(self, news_id: int) -> dict:
-        """Analyze a single news item: translate, summarize, classify, score."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM news WHERE id = ?", (news_id,))
-        news = cursor.fetchone()
+        if slot > now:
+            time.sleep(slot - now)
 
-        if not news:
-            return {"error": "News not found"}
 
-        title = news["original_title"]
-        content = news["original_content"] or ""
+# Outermost {...} of the reply (code fences and surrounding prose are skipped)
+_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
 
-        # Build prompt
-        prompt = f"""다음 중국어 뉴스를 분석해주세요.
 
-원문 제목: {title}
-원문 내용: {content[:3000] if content else "(본문 없음)"}
+# 기사와 무관한 지시문/스키마: system 프롬프트로 보내고 user 메시지에는 기사만 담는다.
+# (최소 캐시 길이보다 짧아 cache_control 을 붙여도 캐싱되지 않으므로 붙이지 않음)
+ANALYSIS_SYSTEM_PROMPT = """다음 중국어 뉴스를 분석해주세요.
 
 다음 JSON 형식으로 응답해주세요:
-{{
+{
     "translated_title": "한국어 번역 제목",
     "summary": "150-300자 한국어 요약 (3-5문장)",
     "importance_score": 0.0-1.0 사이 점수 (정책 영향력, 산업 파급력, 시장 영향 기준),
@@ -59,7 +85,7 @@ class ClaudeAnalyzer:
     "sentiment": "positive/negative/neutral 중 하나",
     "keywords": ["키워드1", "키워드2", "키워드3"],
     "market_impact": "시장 영향 예측 (1-2문장)"
-}}
+}
 
 점수 기준:
 - importance_score: 기관투자자/기업전략팀 관점에서의 중요도
@@ -69,68 +95,106 @@ class ClaudeAnalyzer:
 
 전문 용어는 정확하게 번역해주세요."""
 
+
+UPDATE_ANALYSIS_SQL = """
+    UPDATE news SET
+        translated_title = ?,
+        summary = ?,
+        importance_score = ?,
+        market_relevance_score = ?,
+        uncertainty_score = ?,
+        expert_explainability_score = ?,
+        industry_category = ?,
+        content_type = ?,
+        sentiment = ?,
+        keywords = ?,
+        market_impact = ?,
+        analyzed_at = ?,
+        updated_at = ?
+    WHERE id = ?
+"""
+
+
+class ClaudeAnalyzer:
+    """Analyzer using Claude API for translation, summarization, and scoring."""
+
+    def __init__(self):
+        if not ANTHROPIC_API_KEY:
+            raise ValueError("ANTHROPIC_API_KEY not set")
+
+        import anthropic
+        # One keep-alive pool shared by the concurrent analyze_unanalyzed calls;
+        # HTTP/2 multiplexes them over a single TLS session when h2 is installed
+        self.client = anthropic.Anthropic(
+            api_key=ANTHROPIC_API_KEY,
+            http_client=anthropic.DefaultHttpxClient(http2=_HTTP2_AVAILABLE),
+        )
+        self.model = CLAUDE_MODEL
+        self._rate_limiter = _RequestRateLimiter(CLAUDE_REQUESTS_PER_MINUTE)
+
+    def analyze_news(self, news_id: int) -> dict:
+        """Analyze a single news item: translate, summarize, classify, score."""
+        with pool.reader() as conn:
+            news = conn.execute(
+                "SELECT id, original_title, original_content FROM news WHERE id = ?",
+                (news_id,)
+            ).fetchone()
+
+        if not news:
+            return {"error": "News not found"}
+
+        result = self._call_claude(news)
+        if "error" in result:
+            return result
+
+        vector_params = self._topic_vector_params([news], [result])
+
+        try:
+            # Analysis and topic vector in one transaction (BEGIN IMMEDIATE ... COMMIT)
+            with pool.writer() as conn:
+                conn.execute(UPDATE_ANALYSIS_SQL, self._update_params(news_id, result))
+                if vector_params:
+                    conn.executemany(UPDATE_TOPIC_VECTOR_SQL, vector_params)
+        except Exception as e:
+            logger.error(f"Analysis failed for news {news_id}: {e}")
+            return {"error": str(e)}
+
+        logger.info(f"Analyzed news {news_id}: {result.get('translated_title', '')[:30]}...")
+        return result
+
+    def _call_claude(self, news) -> dict:
+        """Request the analysis for one news row and parse the JSON reply.
+
+        Does not touch the database, so it is safe to run from worker threads.
+
+        Returns:
+            Parsed analysis dict, or {"error": ...} on failure.
+        """
+        news_id = news["id"]
+        title = news["original_title"]
+        content = news["original_content"] or ""
+
+        # Per-article part only; instructions are sent as the system prompt
+        user_message = f"""원문 제목: {title}
+원문 내용: {content[:3000] if content else "(본문 없음)"}"""
+
         try:
+            self._rate_limiter.wait()
             response = self.client.messages.create(
                 model=self.model,
                 max_tokens=MAX_TOKENS,
-                messages=[{"role": "user", "content": prompt}]
+                system=ANALYSIS_SYSTEM_PROMPT,
+                messages=[{"role": "user", "content": user_message}]
             )
 
             result_text = response.content[0].text
 
             # Parse JSON from response
-            json_match = result_text
-            if "```json" in result_text:
-                json_match = result_text.split("```json")[1].split("```")[0]
-            elif "```" in result_text:
-                json_match = result_text.split("```")[1].split("```")[0]
-
-            result = json.loads(json_match.strip())
-
-            # Update database
-            cursor.execute("""
-                UPDATE news SET
-                    translated_title = ?,
-                    summary = ?,
-                    importance_score = ?,
-                    market_relevance_score = ?,
-                    uncertainty_score = ?,
-                    expert_explainability_score = ?,
-                    industry_category = ?,
-                    content_type = ?,
-                    sentiment = ?,
-                    keywords = ?,
-                    market_impact = ?,
-                    analyzed_at = ?,
-                    updated_at = ?
-                WHERE id = ?
-            """, (
-                result.get("translated_title"),
-                result.get("summary"),
-                result.get("importance_score", 0.5),
-                result.get("market_relevance_score", 0.5),
-                result.get("uncertainty_score", 0.5),
-                result.get("expert_explainability_score", 0.5),
-                result.get("industry_category"),
-                result.get("content_type"),
-                result.get("sentiment"),
-                json.dumps(result.get("keywords", []), ensure_ascii=False),
-                result.get("market_impact"),
-                datetime.now(),
-                datetime.now(),
-                news_id,
-            ))
-            conn.commit()
-
-            # Generate topic vector after analysis
-            try:
-                from src.analyzer.embeddings import generate_topic_vector
-                generate_topic_vector(news_id)
-            except Exception as e:
-                logger.warning(f"Failed to generate topic vector for news {news_id}: {e}")
+            json_match = _JSON_RE.search(result_text)
+            if not json_match:
+                raise json.JSONDecodeError("No JSON object in response", result_text, 0)
 
-            logger.info(f"Analyzed news {news_id}: {result.get('translated_title', '')[:30]}...")
-            return result
+            return _json_loads(json_match.group(0))
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {e}")
@@ -138,26 +202,106 @@ class ClaudeAnalyzer:
         except Exception as e:
             logger.error(f"Analysis failed for news {news_id}: {e}")
             return {"error": str(e)}
-        finally:
-            conn.close()
+
+    @staticmethod
+    def _update_params(news_id: int, result: dict) -> tuple:
+        """Build the UPDATE_ANALYSIS_SQL parameters for one analysis result."""
+        now = datetime.now()
+        return (
+            result.get("translated_title"),
+            result.get("summary"),
+            result.get("importance_score", 0.5),
+            result.get("market_relevance_score", 0.5),
+            result.get("uncertainty_score", 0.5),
+            result.get("expert_explainability_score", 0.5),
+            result.get("industry_category"),
+            result.get("content_type"),
+            result.get("sentiment"),
+            json.dumps(result.get("keywords", []), ensure_ascii=False),
+            result.get("market_impact"),
+            now,
+            now,
+            news_id,
+        )
+
+    @staticmethod
+    def _topic_vector_params(rows, analyses) -> list[tuple]:
+        """Batch-embed analyzed rows into UPDATE_TOPIC_VECTOR_SQL parameters.
+
+        Failures are logged, not raised: the analysis is saved without a vector
+        and backfill_topic_vectors() picks it up later.
+        """
+        items = [
+            {
+                "id": row["id"],
+                "original_title": row["original_title"],
+                "original_content": row["original_content"],
+                "summary": result.get("summary"),
+            }
+            for row, result in zip(rows, analyses)
+            if "error" not in result
+        ]
+        if not items:
+            return []
+
+        texts = [build_embedding_text(item) for item in items]
+        try:
+            embeddings = generate_embeddings(texts)
+        except Exception as e:
+            logger.warning(f"Failed to generate topic vectors for {len(items)} news: {e}")
+            return []
+
+        return [
+            (pack_vector(embedding), text_hash(text), item["id"])
+            for item, text, embedding in zip(items, texts, embeddings)
+            if embedding
+        ]
 
     def analyze_unanalyzed(self, limit: int = 10) -> list[dict]:
-        """Analyze all unanalyzed news items."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT id FROM news
-            WHERE analyzed_at IS NULL
-            ORDER BY collected_at DESC
-            LIMIT ?
-        """, (limit,))
-        news_ids = [row["id"] for row in cursor.fetchall()]
-        conn.close()
+        """Analyze all unanalyzed news items.
+
+        API calls run concurrently (CLAUDE_MAX_CONCURRENCY workers, paced to
+        CLAUDE_REQUESTS_PER_MINUTE); topic vectors are batch-encoded and
+        written together with the results in one transaction.
+        """
+        with pool.reader() as conn:
+            rows = conn.execute("""
+                SELECT id, original_title, original_content FROM news
+                WHERE analyzed_at IS NULL
+                ORDER BY collected_at DESC
+                LIMIT ?
+            """, (limit,)).fetchall()
+
+        if not rows:
+            return []
+
+        with ThreadPoolExecutor(max_workers=CLAUDE_MAX_CONCURRENCY) as executor:
+            analyses = list(executor.map(self._call_claude, rows))
+
+        updates = [
+            self._update_params(row["id"], result)
+            for row, result in zip(rows, analyses)
+            if "error" not in result
+        ]
+        vector_params = self._topic_vector_params(rows, analyses)
+        if updates:
+            try:
+                # One transaction (one fsync) for the whole batch
+                with pool.writer() as conn:
+                    conn.executemany(UPDATE_ANALYSIS_SQL, updates)
+                    conn.executemany(UPDATE_TOPIC_VECTOR_SQL, vector_params)
+            except Exception as e:
+                logger.error(f"Failed to save {len(updates)} analyses: {e}")
+                analyses = [
+                    result if "error" in result else {"error": str(e)}
+                    for result in analyses
+                ]
 
         results = []
-        for news_id in news_ids:
-            result = self.analyze_news(news_id)
-            results.append({"news_id": news_id, **result})
+        for row, result in zip(rows, analyses):
+            if "error" not in result:
+                logger.info(f"Analyzed news {row['id']}: {result.get('translated_title', '')[:30]}...")
+            results.append({"news_id": row["id"], **result})
 
         return results
 
@@ -4,16 +4,21 @@ Uses sentence-transformers for generating embeddings from article text.
 Falls back to TF-IDF based vectors if sentence-transformers is not available.
 """
 
+import hashlib
 import json
 import logging
+import threading
+from collections import Counter
+from itertools import islice
 from typing import Optional
-import hashlib
+
+import numpy as np
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-from src.database.models import get_connection
+from src.database.models import pool
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -21,9 +26,25 @@ logger = logging.getLogger(__name__)
 # Embedding dimension for fallback TF-IDF approach
 TFIDF_DIMENSION = 384
 
+# Texts per model.encode() batch
+EMBEDDING_BATCH_SIZE = 64
+
+# topic_vector storage dtype (384 dims -> 768-byte BLOB)
+VECTOR_DTYPE = np.float16
+
+# Parameters: (pack_vector(embedding), text_hash(text), news_id)
+UPDATE_TOPIC_VECTOR_SQL = """
+    UPDATE news
+    SET topic_vector = ?,
+        content_hash = ?,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+
 # Global model cache
 _embedding_model = None
 _use_sentence_transformers = None
+_model_lock = threading.Lock()
 
 
 def _check_sentence_transformers() -> bool:
@@ -44,19 +65,19 @@ def _check_sentence_transformers() -> bool:
 
 
 def _get_embedding_model():
-    """Get or create the embedding model."""
+    """Get or create the embedding model (loaded at most once per process)."""
     global _embedding_model
 
     if _embedding_model is not None:
         return _embedding_model
 
-    if _check_sentence_transformers():
-        from sentence_transformers import SentenceTransformer
-        # Use a multilingual model that works well with Chinese
-        _embedding_model = SentenceTransformer('paraphrase-multilingual-MiniLM-L12-v2')
-        logger.info("Loaded sentence-transformers model")
-    else:
-        _embedding_model = None
+    # Concurrent callers wait for the first load instead of each loading the model
+    with _model_lock:
+        if _embedding_model is None and _check_sentence_transformers():
+            from sentence_transformers import SentenceTransformer
+            # Use a multilingual model that works well with Chinese
+            _embedding_model = SentenceTransformer('paraphrase-multilingual-MiniLM-L12-v2')
+            logger.info("Loaded sentence-transformers model")
 
     return _embedding_model
 
@@ -74,28 +95,32 @@ def generate_tfidf_vector(text: str, dimension: int = TFIDF_DIMENSION) -> list:
     text = text.lower().strip()
 
     # Generate character n-grams (2-4 grams)
-    ngrams = []
-    for n in range(2, 5):
-        for i in range(len(text) - n + 1):
-            ngrams.append(text[i:i+n])
-
-    # Create vector using hashing
-    vector = [0.0] * dimension
-
-    for ngram in ngrams:
-        # Hash the ngram to get bucket index
-        h = int(hashlib.md5(ngram.encode()).hexdigest(), 16)
-        idx = h % dimension
-        # Use another hash for sign
-        sign = 1 if (h // dimension) % 2 == 0 else -1
-        vector[idx] += sign
+    ngrams = [
+        text[i:i+n]
+        for n in range(2, 5)
+        for i in range(len(text) - n + 1)
+    ]
+    if not ngrams:
+        return [0.0] * dimension
+
+    # Hash n-grams with md5 (bucket = h % dimension, sign from (h // dimension) % 2).
+    # The hash must stay md5: vectors already stored in topic_vector were built
+    # this way, and another hash would put new vectors in a different space.
+    # Each distinct n-gram is hashed once and weighted by its count.
+    counts = Counter(ngrams)
+    idx = np.empty(len(counts), dtype=np.int64)
+    weights = np.empty(len(counts), dtype=np.float64)
+    for i, (ngram, count) in enumerate(counts.items()):
+        quotient, idx[i] = divmod(int.from_bytes(hashlib.md5(ngram.encode()).digest(), "big"), dimension)
+        weights[i] = -count if quotient & 1 else count
+    vector = np.bincount(idx, weights=weights, minlength=dimension)
 
     # Normalize vector
-    norm = sum(v * v for v in vector) ** 0.5
+    norm = np.linalg.norm(vector)
     if norm > 0:
-        vector = [v / norm for v in vector]
+        vector /= norm
 
-    return vector
+    return vector.tolist()
 
 
 def generate_embedding(text: str, max_length: int = 512) -> list:
@@ -129,6 +154,75 @@ def generate_embedding(text: str, max_length: int = 512) -> list:
         return generate_tfidf_vector(text)
 
 
+def generate_embeddings(texts: list, max_length: int = 512,
+                        batch_size: int = EMBEDDING_BATCH_SIZE) -> list:
+    """Generate embedding vectors for many texts in one model call.
+
+    Same output as calling generate_embedding() per text, but sentence-transformers
+    encodes the whole list in batches of batch_size.
+
+    Returns:
+        List of embedding vectors (empty list for empty input text)
+    """
+    truncated = [text[:max_length * 2] for text in texts if text]
+
+    model = _get_embedding_model()
+
+    embeddings = None
+    if model is not None and truncated:
+        try:
+            embeddings = model.encode(
+                truncated,
+                batch_size=batch_size,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            ).tolist()
+        except Exception as e:
+            logger.error(f"Error generating sentence embeddings: {e}")
+
+    if embeddings is None:
+        embeddings = [generate_tfidf_vector(text) for text in truncated]
+
+    # Re-align with the input (empty texts get no embedding)
+    encoded = iter(embeddings)
+    return [next(encoded) if text else [] for text in texts]
+
+
+def pack_vector(embedding) -> bytes:
+    """Serialize an embedding for the topic_vector column (float16 BLOB)."""
+    return np.asarray(embedding, dtype=VECTOR_DTYPE).tobytes()
+
+
+def unpack_vector(value) -> Optional[np.ndarray]:
+    """Deserialize a topic_vector column value into a float32 array.
+
+    Rows written before the BLOB format hold a JSON list of floats;
+    those are still decoded.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return np.asarray(json.loads(value), dtype=np.float32)
+    return np.frombuffer(value, dtype=VECTOR_DTYPE).astype(np.float32)
+
+
+def text_hash(text: str) -> str:
+    """Hash of the exact embedding input, stored in news.content_hash."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def build_embedding_text(row) -> str:
+    """Text fed to the embedding model for a news row."""
+    title = row["original_title"] or ""
+    content = row["original_content"] or ""
+    summary = row["summary"] or ""
+
+    # Use summary + title if available, otherwise use content
+    if summary:
+        return f"{title} {summary}"
+    return f"{title} {content[:1000]}"
+
+
 def generate_topic_vector(news_id: int) -> Optional[list]:
     """Generate and store topic vector for a news article.
 
@@ -138,43 +232,34 @@ def generate_topic_vector(news_id: int) -> Optional[list]:
     Returns:
         Generated embedding vector or None if failed
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
     try:
-        cursor.execute("""
-            SELECT original_title, original_content, summary
-            FROM news
-            WHERE id = ?
-        """, (news_id,))
+        with pool.reader() as conn:
+            row = conn.execute("""
+                SELECT original_title, original_content, summary,
+                       topic_vector, content_hash
+                FROM news
+                WHERE id = ?
+            """, (news_id,)).fetchone()
 
-        row = cursor.fetchone()
         if not row:
             logger.warning(f"News {news_id} not found")
             return None
 
         # Combine title and content for embedding
-        title = row["original_title"] or ""
-        content = row["original_content"] or ""
-        summary = row["summary"] or ""
+        text = build_embedding_text(row)
+        digest = text_hash(text)
 
-        # Use summary + title if available, otherwise use content
-        if summary:
-            text = f"{title} {summary}"
-        else:
-            text = f"{title} {content[:1000]}"
+        # Same input as the stored vector: skip the model call
+        if row["topic_vector"] is not None and row["content_hash"] == digest:
+            logger.debug(f"Topic vector for news {news_id} is up to date")
+            return unpack_vector(row["topic_vector"]).tolist()
 
         embedding = generate_embedding(text)
 
         if embedding:
             # Store in database
-            cursor.execute("""
-                UPDATE news
-                SET topic_vector = ?,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (json.dumps(embedding), news_id))
-            conn.commit()
+            with pool.writer() as conn:
+                conn.execute(UPDATE_TOPIC_VECTOR_SQL, (pack_vector(embedding), digest, news_id))
             logger.debug(f"Generated topic vector for news {news_id} (dim={len(embedding)})")
 
         return embedding
@@ -183,9 +268,6 @@ def generate_topic_vector(news_id: int) -> Optional[list]:
         logger.error(f"Error generating topic vector for news {news_id}: {e}")
         return None
 
-    finally:
-        conn.close()
-
 
 def backfill_topic_vectors(limit: int = 100) -> dict:
     """Generate topic vectors for news items that don't have them.
@@ -196,34 +278,41 @@ def backfill_topic_vectors(limit: int = 100) -> dict:
     Returns:
         Summary dict with counts
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
     try:
-        cursor.execute("""
-            SELECT id FROM news
-            WHERE topic_vector IS NULL
-                AND analyzed_at IS NOT NULL
-            ORDER BY importance_score DESC
-            LIMIT ?
-        """, (limit,))
-
-        news_ids = [row["id"] for row in cursor.fetchall()]
-        conn.close()
-
-        success_count = 0
-        error_count = 0
-
-        for news_id in news_ids:
-            result = generate_topic_vector(news_id)
-            if result:
-                success_count += 1
-            else:
-                error_count += 1
+        processed = 0
+        updates = []
+
+        with pool.reader() as conn:
+            cursor = conn.execute("""
+                SELECT id, original_title, original_content, summary
+                FROM news
+                WHERE topic_vector IS NULL
+                    AND analyzed_at IS NOT NULL
+                ORDER BY importance_score DESC
+                LIMIT ?
+            """, (limit,))
+
+            # Stream rows in encode-sized chunks; only the packed vectors are kept
+            while rows := list(islice(cursor, EMBEDDING_BATCH_SIZE)):
+                processed += len(rows)
+                texts = [build_embedding_text(row) for row in rows]
+                embeddings = generate_embeddings(texts, batch_size=EMBEDDING_BATCH_SIZE)
+                updates.extend(
+                    (pack_vector(embedding), text_hash(text), row["id"])
+                    for row, text, embedding in zip(rows, texts, embeddings)
+                    if embedding
+                )
+
+        if updates:
+            with pool.writer() as conn:
+                conn.executemany(UPDATE_TOPIC_VECTOR_SQL, updates)
+
+        success_count = len(updates)
+        error_count = processed - success_count
 
         logger.info(f"Backfilled topic vectors: {success_count} success, {error_count} errors")
         return {
-            "processed": len(news_ids),
+            "processed": processed,
             "success": success_count,
             "errors": error_count,
         }
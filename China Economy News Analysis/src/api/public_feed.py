@@ -3,25 +3,30 @@
 Provides functions to retrieve expert-reviewed news for public consumption.
 """
 
-import sqlite3
-from typing import Optional
+from typing import Iterator, Optional
 from datetime import datetime, date
 from pathlib import Path
 import sys
+import threading
+import time
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
-from config.settings import DATABASE_PATH
+from src.database.models import pool
 
+# get_available_dates() result cache (seconds); the date list changes at most
+# a few times a day but is requested on every page load
+AVAILABLE_DATES_TTL = 60
 
-def get_connection() -> sqlite3.Connection:
-    """Get database connection with row factory."""
-    conn = sqlite3.connect(DATABASE_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+_available_dates_cache: Optional[tuple[float, list[str]]] = None
+_available_dates_lock = threading.Lock()
 
 
-def get_published_news(limit: int = 10, offset: int = 0) -> list[dict]:
-    """Retrieve expert-reviewed news for public display.
+def iter_published_news(limit: int = 10, offset: int = 0) -> Iterator[dict]:
+    """Iterate expert-reviewed news for public display.
+
+    The page is fetched and the pooled connection returned before the first
+    item is yielded, so a slow or abandoned consumer never holds a reader
+    connection (and its WAL snapshot) open. Only the dict conversion is lazy.
 
     Only returns news where expert_comment IS NOT NULL.
 
@@ -29,8 +34,8 @@ def get_published_news(limit: int = 10, offset: int = 0) -> list[dict]:
         limit: Maximum number of news items to return (default: 10)
         offset: Number of items to skip for pagination (default: 0)
 
-    Returns:
-        List of news dictionaries with fields:
+    Yields:
+        News dictionaries with fields:
         - id: News ID
         - headline: Translated title (Korean)
         - expert_review: Expert's comment/review
@@ -41,9 +46,6 @@ def get_published_news(limit: int = 10, offset: int = 0) -> list[dict]:
         - category: Industry category
         - summary: AI-generated summary
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
     query = """
         SELECT
             n.id,
@@ -65,11 +67,19 @@ def get_published_news(limit: int = 10, offset: int = 0) -> list[dict]:
         LIMIT ? OFFSET ?
     """
 
-    cursor.execute(query, (limit, offset))
-    rows = cursor.fetchall()
-    conn.close()
+    with pool.reader() as conn:
+        rows = conn.execute(query, (limit, offset)).fetchall()
 
-    return [dict(row) for row in rows]
+    for row in rows:
+        yield dict(row)
+
+
+def get_published_news(limit: int = 10, offset: int = 0) -> list[dict]:
+    """Retrieve expert-reviewed news for public display.
+
+    List form of iter_published_news(); see there for the returned fields.
+    """
+    return list(iter_published_news(limit, offset))
 
 
 def get_published_news_count() -> int:
@@ -78,9 +88,6 @@ def get_published_news_count() -> int:
     Returns:
         Total number of news items with expert comments
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
     query = """
         SELECT COUNT(*)
         FROM news n
@@ -90,9 +97,8 @@ def get_published_news_count() -> int:
           AND n.original_content IS NOT NULL AND TRIM(n.original_content) != ''
     """
 
-    cursor.execute(query)
-    count = cursor.fetchone()[0]
-    conn.close()
+    with pool.reader() as conn:
+        count = conn.execute(query).fetchone()[0]
 
     return count
 
@@ -106,9 +112,6 @@ def get_news_by_id(news_id: int) -> Optional[dict]:
     Returns:
         News dictionary if found and has expert review, None otherwise
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
     query = """
         SELECT
             n.id,
@@ -131,9 +134,8 @@ def get_news_by_id(news_id: int) -> Optional[dict]:
           AND n.original_content IS NOT NULL AND TRIM(n.original_content) != ''
     """
 
-    cursor.execute(query, (news_id,))
-    row = cursor.fetchone()
-    conn.close()
+    with pool.reader() as conn:
+        row = conn.execute(query, (news_id,)).fetchone()
 
     return dict(row) if row else None
 
@@ -148,9 +150,6 @@ def get_published_news_by_date(target_date: date, limit: int = 50) -> list[dict]
     Returns:
         List of news dictionaries for that date
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
     query = """
         SELECT
             n.id,
@@ -173,9 +172,8 @@ def get_published_news_by_date(target_date: date, limit: int = 50) -> list[dict]
         LIMIT ?
     """
 
-    cursor.execute(query, (target_date.isoformat(), limit))
-    rows = cursor.fetchall()
-    conn.close()
+    with pool.reader() as conn:
+        rows = conn.execute(query, (target_date.isoformat(), limit)).fetchall()
 
     return [dict(row) for row in rows]
 
@@ -183,12 +181,24 @@ def get_published_news_by_date(target_date: date, limit: int = 50) -> list[dict]
 def get_available_dates() -> list[str]:
     """Get list of dates that have published news.
 
+    Cached for AVAILABLE_DATES_TTL seconds.
+
     Returns:
         List of date strings (ISO format) in descending order
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    global _available_dates_cache
+
+    with _available_dates_lock:
+        cached = _available_dates_cache
+        if cached is None or cached[0] <= time.monotonic():
+            cached = (time.monotonic() + AVAILABLE_DATES_TTL, _query_available_dates())
+            _available_dates_cache = cached
+
+    return list(cached[1])
 
+
+def _query_available_dates() -> list[str]:
+    """Uncached query behind get_available_dates()."""
     query = """
         SELECT DISTINCT DATE(n.published_at) AS news_date
         FROM news n
@@ -199,9 +209,8 @@ def get_available_dates() -> list[str]:
         ORDER BY news_date DESC
     """
 
-    cursor.execute(query)
-    rows = cursor.fetchall()
-    conn.close()
+    with pool.reader() as conn:
+        rows = conn.execute(query).fetchall()
 
     return [row['news_date'] for row in rows if row['news_date']]
 
@@ -232,9 +241,6 @@ def get_today_headlines(target_date: Optional[date] = None, period: Optional[str
     else:
         title = "오늘 오후 중국경제 뉴스 헤드라인"
 
-    conn = get_connection()
-    cursor = conn.cursor()
-
     query = """
         SELECT
             n.id,
@@ -252,9 +258,8 @@ def get_today_headlines(target_date: Optional[date] = None, period: Optional[str
         LIMIT 10
     """
 
-    cursor.execute(query, (target_date.isoformat(),))
-    rows = cursor.fetchall()
-    conn.close()
+    with pool.reader() as conn:
+        rows = conn.execute(query, (target_date.isoformat(),)).fetchall()
 
     headlines = []
     for i, row in enumerate(rows, 1):
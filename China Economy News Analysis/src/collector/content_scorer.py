@@ -15,6 +15,7 @@ import json
 import logging
 import re
 import sys
+from bisect import bisect_right
 from pathlib import Path
 from typing import Optional
 
@@ -43,17 +44,145 @@ from config.content_scoring import (
 logger = logging.getLogger(__name__)
 
 
+try:
+    import ahocorasick  # Optional: pyahocorasick (single-pass keyword matching)
+except ImportError:
+    ahocorasick = None
+
+
+class _KeywordMatcher:
+    """키워드 목록 중 본문에 등장하는 키워드 집합을 구한다.
+
+    pyahocorasick이 있으면 Aho-Corasick 오토마톤으로 본문을 한 번만 훑고,
+    없으면 첫 글자가 본문에 있는 키워드만 부분 문자열 검사로 확인한다
+    (결과는 동일). 존재 여부만 보는 contains_any()는 폴백 시 키워드 전체를
+    묶은 정규식 alternation 한 번으로 검사한다.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = tuple(dict.fromkeys(keywords))
+        self._automaton = None
+        self._pattern = None
+        if ahocorasick is not None and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for kw in self.keywords:
+                automaton.add_word(kw, kw)
+            automaton.make_automaton()
+            self._automaton = automaton
+        elif self.keywords:
+            self._pattern = re.compile("|".join(map(re.escape, self.keywords)))
+
+    def find(self, text: str) -> set:
+        """본문에 (부분 문자열로) 포함된 키워드 집합."""
+        if self._automaton is not None:
+            return {kw for _, kw in self._automaton.iter(text)}
+        chars = set(text)
+        return {kw for kw in self.keywords if kw[0] in chars and kw in text}
+
+    def contains_any(self, text: str) -> bool:
+        """본문에 키워드가 하나라도 있으면 True (첫 매칭에서 종료)."""
+        if self._automaton is not None:
+            for _ in self._automaton.iter(text):
+                return True
+            return False
+        return self._pattern is not None and self._pattern.search(text) is not None
+
+
+def _tier_keywords(table: dict) -> frozenset:
+    """등급별 키워드 사전의 전체 키워드 집합."""
+    return frozenset(kw for info in table.values() for kw in info["keywords"])
+
+
+def _sorted_tiers(table: dict) -> list:
+    """등급별 키워드 사전을 (점수, 정보) 리스트로 변환 (높은 점수부터)."""
+    return [(score_val, table[score_val]) for score_val in sorted(table.keys(), reverse=True)]
+
+
+# 등급 순서 (모듈 로드 시 1회)
+_POLICY_TIERS = _sorted_tiers(POLICY_HIERARCHY)
+_INDUSTRY_TIERS = _sorted_tiers(STRATEGIC_INDUSTRIES)
+_GEOGRAPHIC_TIERS = _sorted_tiers(GEOGRAPHIC_SCORES)
+_TIME_TIERS = _sorted_tiers(TIME_SENSITIVITY)
+_INTERNATIONAL_TIERS = _sorted_tiers(INTERNATIONAL_IMPACT)
+_SOCIAL_TIERS = _sorted_tiers(SOCIAL_IMPACT)
+
+# 기준별 전체 키워드 집합: 본문 매칭 결과와 겹치지 않으면 해당 기준 순회 생략
+_POLICY_KEYWORDS = _tier_keywords(POLICY_HIERARCHY)
+_INDUSTRY_KEYWORDS = _tier_keywords(STRATEGIC_INDUSTRIES)
+_GEOGRAPHIC_KEYWORDS = _tier_keywords(GEOGRAPHIC_SCORES)
+_TIME_KEYWORDS = _tier_keywords(TIME_SENSITIVITY)
+_INTERNATIONAL_KEYWORDS = _tier_keywords(INTERNATIONAL_IMPACT)
+_SOCIAL_KEYWORDS = _tier_keywords(SOCIAL_IMPACT)
+
+# 중앙기업/민영기업 이름 (설정 순서 유지, 중복 제거 → matched 표시 순서 고정)
+_CENTRAL_SOES = tuple(dict.fromkeys(CENTRAL_SOES))
+_PRIVATE_CORPS = tuple(dict.fromkeys(MAJOR_PRIVATE_CORPS))
+
+# 전략산업 중앙기업 판별 키워드
+_STRATEGIC_SOE_KEYWORDS = frozenset(STRATEGIC_SOE_KEYWORDS)
+
+# 기업 규모 불명 시 일반 기업 언급 키워드
+_GENERAL_CORP_KEYWORDS = frozenset(["企业", "公司", "集团"])
+
+# 기업 계층 판별에 쓰이는 전체 키워드
+_CORPORATE_KEYWORDS = (
+    frozenset(_CENTRAL_SOES) | frozenset(_PRIVATE_CORPS)
+    | _STRATEGIC_SOE_KEYWORDS | _GENERAL_CORP_KEYWORDS
+    | frozenset(kw for kws in CORPORATE_TYPE_KEYWORDS.values() for kw in kws)
+)
+
+# 전체 키워드 사전을 하나로 합친 매처: score() 1회당 본문 스캔 1회
+# (각 기준은 자기 키워드만 조회하므로 결과 집합을 공유해도 점수는 동일)
+_KEYWORD_MATCHER = _KeywordMatcher(
+    [kw for table in (POLICY_HIERARCHY, STRATEGIC_INDUSTRIES, GEOGRAPHIC_SCORES,
+                      TIME_SENSITIVITY, INTERNATIONAL_IMPACT, SOCIAL_IMPACT)
+     for info in table.values() for kw in info["keywords"]]
+    + list(CENTRAL_SOES) + list(MAJOR_PRIVATE_CORPS) + list(STRATEGIC_SOE_KEYWORDS)
+    + [kw for kws in CORPORATE_TYPE_KEYWORDS.values() for kw in kws]
+    + list(_GENERAL_CORP_KEYWORDS)
+    + list(FOOD_SECURITY_KEYWORDS)
+    + [kw for kws in IMPACT_SCOPE_KEYWORDS.values() for kw in kws]
+    + [kw for config in BOOSTER_KEYWORDS.values() for kw in config["keywords"]]
+)
+
+# 기준별 가중치 (SCORING_WEIGHTS 순서 그대로, 합산 순서 유지)
+_WEIGHT_ITEMS = tuple(SCORING_WEIGHTS.items())
+
+# 설명 문구용 (기준 키, 라벨, 가중치) - 표시 순서 고정
+_EXPLANATION_ITEMS = (
+    ("policy_hierarchy", "정책계층", 0.25),
+    ("corporate_hierarchy", "기업계층", 0.15),
+    ("strategic_industry", "산업전략", 0.20),
+    ("economic_scale", "경제규모", 0.15),
+    ("geographic_significance", "지리중요", 0.10),
+    ("time_sensitivity", "시간긴급", 0.05),
+    ("international_impact", "국제영향", 0.05),
+    ("social_impact", "사회파급", 0.05),
+)
+
+# 라벨 뒤에 붙일 상세 필드 (앞에서부터 처음 값이 있는 것 하나)
+_EXPLANATION_DETAIL_KEYS = ("level", "type", "industry", "region")
+
+# 금액 구간 (오름차순 정렬, bisect 조회용)
+_AMOUNT_THRESHOLDS, _AMOUNT_THRESHOLD_SCORES = map(tuple, zip(*sorted(ECONOMIC_SCALE_THRESHOLDS)))
+
+# 경제 규모 금액 패턴: "N万亿" / "N亿" / "千亿" (세 표현은 서로 겹치지 않음)
+_AMOUNT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(万亿|亿)|千亿")
+
+
 class ContentScorer:
     """뉴스 내용 기반 점수 평가기.
 
     제목과 본문을 분석하여 8가지 기준의 세부 점수와 종합 점수를 계산한다.
     """
 
+    __slots__ = ("_central_soes", "_private_corps", "_strategic_soe_kw")
+
     def __init__(self):
-        # 중앙기업/민영기업 이름을 세트로 변환 (빠른 검색)
-        self._central_soes = set(CENTRAL_SOES)
-        self._private_corps = set(MAJOR_PRIVATE_CORPS)
-        self._strategic_soe_kw = STRATEGIC_SOE_KEYWORDS
+        # 중앙기업/민영기업 이름 목록 (모듈 로드 시 1회 생성, 인스턴스 간 공유)
+        self._central_soes = _CENTRAL_SOES
+        self._private_corps = _PRIVATE_CORPS
+        self._strategic_soe_kw = _STRATEGIC_SOE_KEYWORDS
 
     def score(self, title: str, content: str, source: str = "") -> dict:
         """뉴스 종합 점수 계산.
@@ -72,15 +201,18 @@ class ContentScorer:
         """
         text = title + content
 
+        # 전체 키워드를 한 번에 스캔하고 결과 집합을 모든 기준이 공유
+        found = _KEYWORD_MATCHER.find(text)
+
         # 8가지 기준별 점수 계산
-        policy = self._score_policy_hierarchy(text)
-        corporate = self._score_corporate_hierarchy(text)
-        industry = self._score_strategic_industry(text)
-        economic = self._score_economic_scale(text)
-        geographic = self._score_geographic(text)
-        time_sens = self._score_time_sensitivity(text)
-        international = self._score_international_impact(text)
-        social = self._score_social_impact(text)
+        policy = self._score_policy_hierarchy(text, found)
+        corporate = self._score_corporate_hierarchy(text, found)
+        industry = self._score_strategic_industry(text, found)
+        economic = self._score_economic_scale(text, found)
+        geographic = self._score_geographic(text, found)
+        time_sens = self._score_time_sensitivity(text, found)
+        international = self._score_international_impact(text, found)
+        social = self._score_social_impact(text, found)
 
         breakdown = {
             "policy_hierarchy": policy,
@@ -95,12 +227,12 @@ class ContentScorer:
 
         # 가중 평균 계산
         weighted_score = sum(
-            breakdown[key]["score"] * SCORING_WEIGHTS[key]
-            for key in SCORING_WEIGHTS
+            breakdown[key]["score"] * weight
+            for key, weight in _WEIGHT_ITEMS
         )
 
         # 부스터 적용 (combined multiplier capped at 1.3)
-        boosters = self._apply_boosters(text, breakdown)
+        boosters = self._apply_boosters(text, breakdown, found)
         multiplier = 1.0
         for b in boosters:
             multiplier *= b["multiplier"]
@@ -123,56 +255,70 @@ class ContentScorer:
     # =========================================================================
     # 1. 정책/제도 계층 (Policy Hierarchy)
     # =========================================================================
-    def _score_policy_hierarchy(self, text: str) -> dict:
+    def _score_policy_hierarchy(self, text: str, found: Optional[set] = None) -> dict:
         """정책 계층 점수: 전인대(100) > 국무원(95) > 부위급(80) > 성급(60) > 시급(40) > 현급(20)"""
         best_score = 0
         matched_level = ""
-        matched_keywords = []
+        matched_keywords = {}  # 삽입 순서 유지 + 중복 제거
+
+        if found is None:
+            found = _KEYWORD_MATCHER.find(text)
 
-        for score_val in sorted(POLICY_HIERARCHY.keys(), reverse=True):
-            level_info = POLICY_HIERARCHY[score_val]
+        # 이 기준의 키워드가 본문에 하나도 없으면 등급 순회 생략
+        tiers = _POLICY_TIERS if not _POLICY_KEYWORDS.isdisjoint(found) else ()
+        for score_val, level_info in tiers:
             for kw in level_info["keywords"]:
-                if kw in text:
+                if kw in found:
                     if score_val > best_score:
                         best_score = score_val
                         matched_level = level_info["name"]
-                    matched_keywords.append(kw)
+                    matched_keywords[kw] = None
+                    # 등급은 처음 매칭된 (가장 높은) 레벨로 확정, 표시용 5개도 확보됨
+                    if len(matched_keywords) >= 5:
+                        break
 
             # 최고 점수 이미 확보되면 하위 레벨 키워드는 수집만
-            if best_score == 100:
+            if best_score == 100 or len(matched_keywords) >= 5:
                 break
 
         return {
             "score": best_score,
             "level": matched_level,
-            "matched": matched_keywords[:5],
+            "matched": list(matched_keywords)[:5],
         }
 
     # =========================================================================
     # 2. 기업/주체 계층 (Corporate Hierarchy)
     # =========================================================================
-    def _score_corporate_hierarchy(self, text: str) -> dict:
+    def _score_corporate_hierarchy(self, text: str, found: Optional[set] = None) -> dict:
         """기업 계층 점수: 중앙기업 전략(100) > 중앙기업 일반(85) > 대형 민영(80) > 지방 국기업(60) > 중소(40) > 외자(60)"""
         best_score = 0
         matched_type = ""
-        matched_entities = []
+        matched_entities = {}  # 삽입 순서 유지 + 중복 제거
+
+        if found is None:
+            found = _KEYWORD_MATCHER.find(text)
+
+        # 기업 관련 키워드가 하나도 없으면 0점
+        if _CORPORATE_KEYWORDS.isdisjoint(found):
+            return {"score": 0, "type": "", "matched": []}
 
         # 중앙기업 확인
         has_central_soe = False
         for name in self._central_soes:
-            if name in text:
+            if name in found:
                 has_central_soe = True
-                matched_entities.append(name)
+                matched_entities[name] = None
 
         # 중앙기업 키워드 확인
         for kw in CORPORATE_TYPE_KEYWORDS["central_soe"]:
-            if kw in text:
+            if kw in found:
                 has_central_soe = True
-                matched_entities.append(kw)
+                matched_entities[kw] = None
 
         if has_central_soe:
             # 전략산업 중앙기업인지 추가 확인
-            is_strategic = any(kw in text for kw in self._strategic_soe_kw)
+            is_strategic = not self._strategic_soe_kw.isdisjoint(found)
             if is_strategic:
                 best_score = 100
                 matched_type = "중앙기업(전략산업)"
@@ -183,96 +329,118 @@ class ContentScorer:
         # 대형 민영기업 확인
         if best_score < 80:
             for name in self._private_corps:
-                if name in text:
+                if name in found:
                     best_score = max(best_score, 80)
                     matched_type = "대형 민영기업"
-                    matched_entities.append(name)
+                    matched_entities[name] = None
 
             # 상장/유니콘 키워드
             for kw in CORPORATE_TYPE_KEYWORDS["listed"]:
-                if kw in text:
+                if kw in found:
                     best_score = max(best_score, 80)
                     if not matched_type:
                         matched_type = "상장기업"
-                    matched_entities.append(kw)
+                    matched_entities[kw] = None
 
             for kw in CORPORATE_TYPE_KEYWORDS["unicorn"]:
-                if kw in text:
+                if kw in found:
                     best_score = max(best_score, 80)
                     if not matched_type:
                         matched_type = "유니콘기업"
-                    matched_entities.append(kw)
+                    matched_entities[kw] = None
 
         # 외자기업
         if best_score < 60:
             for kw in CORPORATE_TYPE_KEYWORDS["foreign"]:
-                if kw in text:
+                if kw in found:
                     best_score = max(best_score, 60)
                     matched_type = "외자기업"
-                    matched_entities.append(kw)
+                    matched_entities[kw] = None
 
         # 지방 국기업
         if best_score < 60:
             for kw in CORPORATE_TYPE_KEYWORDS["local_soe"]:
-                if kw in text:
+                if kw in found:
                     best_score = max(best_score, 60)
                     matched_type = "지방 국유기업"
-                    matched_entities.append(kw)
+                    matched_entities[kw] = None
 
         # 중소기업 (기업 언급은 있으나 위에 해당하지 않는 경우)
         if best_score == 0:
-            general_kw = ["企业", "公司", "集团"]
-            if any(kw in text for kw in general_kw):
+            if not _GENERAL_CORP_KEYWORDS.isdisjoint(found):
                 best_score = 40
                 matched_type = "중소 민영기업"
 
         return {
             "score": best_score,
             "type": matched_type,
-            "matched": list(set(matched_entities))[:5],
+            "matched": list(matched_entities)[:5],
         }
 
     # =========================================================================
     # 3. 산업/기술 전략성 (Strategic Industry)
     # =========================================================================
-    def _score_strategic_industry(self, text: str) -> dict:
+    def _score_strategic_industry(self, text: str, found: Optional[set] = None) -> dict:
         """산업 전략성 점수: 핵심(100) > 중요(80) > 금융(75) > 부동산(60) > 전통(40)"""
         best_score = 0
         matched_industry = ""
-        matched_keywords = []
+        matched_keywords = {}  # 삽입 순서 유지 + 중복 제거
+
+        if found is None:
+            found = _KEYWORD_MATCHER.find(text)
 
         # 식량안보 특별 처리
         for kw in FOOD_SECURITY_KEYWORDS:
-            if kw in text:
+            if kw in found:
                 best_score = max(best_score, 80)
                 matched_industry = "식량안보"
-                matched_keywords.append(kw)
+                matched_keywords[kw] = None
 
-        for score_val in sorted(STRATEGIC_INDUSTRIES.keys(), reverse=True):
-            industry_info = STRATEGIC_INDUSTRIES[score_val]
+        # 이 기준의 키워드가 본문에 하나도 없으면 등급 순회 생략
+        tiers = _INDUSTRY_TIERS if not _INDUSTRY_KEYWORDS.isdisjoint(found) else ()
+        for score_val, industry_info in tiers:
             for kw in industry_info["keywords"]:
-                if kw in text:
+                if kw in found:
                     if score_val > best_score:
                         best_score = score_val
                         matched_industry = industry_info["name"]
-                    matched_keywords.append(kw)
+                    matched_keywords[kw] = None
+                    # 남은 키워드/등급으로는 점수가 오르지 않고 표시용 5개도 확보됨
+                    if best_score >= score_val and len(matched_keywords) >= 5:
+                        break
+
+            if best_score >= score_val and len(matched_keywords) >= 5:
+                break
 
         return {
             "score": best_score,
             "industry": matched_industry,
-            "matched": list(set(matched_keywords))[:5],
+            "matched": list(matched_keywords)[:5],
         }
 
     # =========================================================================
     # 4. 경제 규모/영향도 (Economic Scale)
     # =========================================================================
-    def _score_economic_scale(self, text: str) -> dict:
+    def _score_economic_scale(self, text: str, found: Optional[set] = None) -> dict:
         """경제 규모 점수: 금액 크기와 영향 범위로 산정"""
         max_amount = 0
         amount_text = ""
 
+        # 금액 표현을 한 번의 스캔으로 단위별 분류
+        wan_yi_matches = []
+        yi_matches = []
+        has_qian_yi = False
+        for match in _AMOUNT_RE.finditer(text):
+            unit = match.group(2)
+            if unit == "万亿":
+                wan_yi_matches.append(match)
+            elif unit == "亿":
+                yi_matches.append(match)
+            else:
+                has_qian_yi = True
+
         # 만억(조) 단위 패턴
-        for match in re.finditer(r"(\d+(?:\.\d+)?)\s*万亿", text):
+        for match in wan_yi_matches:
             val = float(match.group(1)) * 1_0000_0000_0000
             if val > max_amount:
                 max_amount = val
@@ -280,32 +448,30 @@ class ContentScorer:
 
         # 천억 단위
         if max_amount == 0:
-            m = re.search(r"千亿", text)
-            if m:
+            if has_qian_yi:
                 max_amount = 100_000_000_000
                 amount_text = "千亿"
 
         # 억 단위 패턴
         if max_amount < 100_000_000:
-            for match in re.finditer(r"(\d+(?:\.\d+)?)\s*亿", text):
+            for match in yi_matches:
                 val = float(match.group(1)) * 100_000_000
                 if val > max_amount:
                     max_amount = val
                     amount_text = match.group(0)
 
-        # 금액 기준 점수
-        amount_score = 0
-        for threshold, score_val in ECONOMIC_SCALE_THRESHOLDS:
-            if max_amount >= threshold:
-                amount_score = score_val
-                break
+        # 금액 기준 점수 (max_amount 이하인 가장 큰 구간)
+        idx = bisect_right(_AMOUNT_THRESHOLDS, max_amount)
+        amount_score = _AMOUNT_THRESHOLD_SCORES[idx - 1] if idx else 0
 
         # 영향 범위 보너스
         scope_bonus = 0
         scope_matched = []
+        if found is None:
+            found = _KEYWORD_MATCHER.find(text)
         for bonus, keywords in IMPACT_SCOPE_KEYWORDS.items():
             for kw in keywords:
-                if kw in text:
+                if kw in found:
                     scope_bonus = max(scope_bonus, bonus)
                     scope_matched.append(kw)
 
@@ -322,103 +488,143 @@ class ContentScorer:
     # =========================================================================
     # 5. 지리적 중요도 (Geographic Significance)
     # =========================================================================
-    def _score_geographic(self, text: str) -> dict:
+    def _score_geographic(self, text: str, found: Optional[set] = None) -> dict:
         """지리적 중요도 점수: 베이징/상하이(100) > 선전/광저우(85) > 특구(80) > 성급(60)"""
         best_score = 0
         matched_region = ""
-        matched_keywords = []
+        matched_keywords = {}  # 삽입 순서 유지 + 중복 제거
 
-        for score_val in sorted(GEOGRAPHIC_SCORES.keys(), reverse=True):
-            geo_info = GEOGRAPHIC_SCORES[score_val]
+        if found is None:
+            found = _KEYWORD_MATCHER.find(text)
+
+        # 이 기준의 키워드가 본문에 하나도 없으면 등급 순회 생략
+        tiers = _GEOGRAPHIC_TIERS if not _GEOGRAPHIC_KEYWORDS.isdisjoint(found) else ()
+        for score_val, geo_info in tiers:
             for kw in geo_info["keywords"]:
-                if kw in text:
+                if kw in found:
                     if score_val > best_score:
                         best_score = score_val
                         matched_region = geo_info["name"]
-                    matched_keywords.append(kw)
+                    matched_keywords[kw] = None
+                    # 남은 키워드/등급으로는 점수가 오르지 않고 표시용 5개도 확보됨
+                    if best_score >= score_val and len(matched_keywords) >= 5:
+                        break
+
+            if best_score >= score_val and len(matched_keywords) >= 5:
+                break
 
         return {
             "score": best_score,
             "region": matched_region,
-            "matched": list(set(matched_keywords))[:5],
+            "matched": list(matched_keywords)[:5],
         }
 
     # =========================================================================
     # 6. 시간적 긴급성 (Time Sensitivity)
     # =========================================================================
-    def _score_time_sensitivity(self, text: str) -> dict:
+    def _score_time_sensitivity(self, text: str, found: Optional[set] = None) -> dict:
         """시간적 긴급성 점수: 돌발(100) > 당일(90) > 단기(70) > 중장기(50)"""
         best_score = 0
         matched_level = ""
-        matched_keywords = []
+        matched_keywords = {}  # 삽입 순서 유지 + 중복 제거
 
-        for score_val in sorted(TIME_SENSITIVITY.keys(), reverse=True):
-            ts_info = TIME_SENSITIVITY[score_val]
+        if found is None:
+            found = _KEYWORD_MATCHER.find(text)
+
+        # 이 기준의 키워드가 본문에 하나도 없으면 등급 순회 생략
+        tiers = _TIME_TIERS if not _TIME_KEYWORDS.isdisjoint(found) else ()
+        for score_val, ts_info in tiers:
             for kw in ts_info["keywords"]:
-                if kw in text:
+                if kw in found:
                     if score_val > best_score:
                         best_score = score_val
                         matched_level = ts_info["name"]
-                    matched_keywords.append(kw)
+                    matched_keywords[kw] = None
+                    if len(matched_keywords) >= 3:
+                        break
+
+            # 등급이 높은 순으로 순회하므로 처음 매칭된 등급에서 확정
+            if best_score:
+                break
 
         return {
             "score": best_score,
             "level": matched_level,
-            "matched": list(set(matched_keywords))[:3],
+            "matched": list(matched_keywords)[:3],
         }
 
     # =========================================================================
     # 7. 국제적 영향도 (International Impact)
     # =========================================================================
-    def _score_international_impact(self, text: str) -> dict:
+    def _score_international_impact(self, text: str, found: Optional[set] = None) -> dict:
         """국제적 영향도 점수: 미중(100) > 공급망(90) > 일대일로(80) > FDI(75) > 기타(60)"""
         best_score = 0
         matched_type = ""
-        matched_keywords = []
+        matched_keywords = {}  # 삽입 순서 유지 + 중복 제거
 
-        for score_val in sorted(INTERNATIONAL_IMPACT.keys(), reverse=True):
-            impact_info = INTERNATIONAL_IMPACT[score_val]
+        if found is None:
+            found = _KEYWORD_MATCHER.find(text)
+
+        # 이 기준의 키워드가 본문에 하나도 없으면 등급 순회 생략
+        tiers = _INTERNATIONAL_TIERS if not _INTERNATIONAL_KEYWORDS.isdisjoint(found) else ()
+        for score_val, impact_info in tiers:
             for kw in impact_info["keywords"]:
-                if kw in text:
+                if kw in found:
                     if score_val > best_score:
                         best_score = score_val
                         matched_type = impact_info["name"]
-                    matched_keywords.append(kw)
+                    matched_keywords[kw] = None
+                    if len(matched_keywords) >= 3:
+                        break
+
+            # 등급이 높은 순으로 순회하므로 처음 매칭된 등급에서 확정
+            if best_score:
+                break
 
         return {
             "score": best_score,
             "type": matched_type,
-            "matched": list(set(matched_keywords))[:3],
+            "matched": list(matched_keywords)[:3],
         }
 
     # =========================================================================
     # 8. 사회적 파급효과 (Social Impact)
     # =========================================================================
-    def _score_social_impact(self, text: str) -> dict:
+    def _score_social_impact(self, text: str, found: Optional[set] = None) -> dict:
         """사회적 파급효과 점수: 고용(100) > 민생(90) > 환경(80) > 공공안전(60)"""
         best_score = 0
         matched_type = ""
-        matched_keywords = []
+        matched_keywords = {}  # 삽입 순서 유지 + 중복 제거
 
-        for score_val in sorted(SOCIAL_IMPACT.keys(), reverse=True):
-            si_info = SOCIAL_IMPACT[score_val]
+        if found is None:
+            found = _KEYWORD_MATCHER.find(text)
+
+        # 이 기준의 키워드가 본문에 하나도 없으면 등급 순회 생략
+        tiers = _SOCIAL_TIERS if not _SOCIAL_KEYWORDS.isdisjoint(found) else ()
+        for score_val, si_info in tiers:
             for kw in si_info["keywords"]:
-                if kw in text:
+                if kw in found:
                     if score_val > best_score:
                         best_score = score_val
                         matched_type = si_info["name"]
-                    matched_keywords.append(kw)
+                    matched_keywords[kw] = None
+                    if len(matched_keywords) >= 3:
+                        break
+
+            # 등급이 높은 순으로 순회하므로 처음 매칭된 등급에서 확정
+            if best_score:
+                break
 
         return {
             "score": best_score,
             "type": matched_type,
-            "matched": list(set(matched_keywords))[:3],
+            "matched": list(matched_keywords)[:3],
         }
 
     # =========================================================================
     # 부스터 적용
     # =========================================================================
-    def _apply_boosters(self, text: str, breakdown: dict) -> list:
+    def _apply_boosters(self, text: str, breakdown: dict, found: Optional[set] = None) -> list:
         """부스터 조건 확인 및 적용.
 
         - 최고 지도부 언급: x1.5
@@ -427,10 +633,12 @@ class ContentScorer:
         """
         boosters = []
 
-        # 키워드 기반 부스터
+        # 키워드 기반 부스터 (found: score()의 전체 스캔 결과 재사용)
+        if found is None:
+            found = _KEYWORD_MATCHER.find(text)
         for booster_key, config in BOOSTER_KEYWORDS.items():
             for kw in config["keywords"]:
-                if kw in text:
+                if kw in found:
                     boosters.append({
                         "name": booster_key,
                         "multiplier": config["multiplier"],
@@ -455,41 +663,25 @@ class ContentScorer:
     # =========================================================================
     # 점수 설명 생성
     # =========================================================================
+    @staticmethod
+    def _explanation_part(label: str, detail: dict, weight: float) -> str:
+        """기준 하나의 설명 조각 (예: 정책계층/국무원(23.8점))."""
+        extra = next(
+            (f"/{detail[k]}" for k in _EXPLANATION_DETAIL_KEYS if detail.get(k)),
+            "",
+        )
+        return f"{label}{extra}({detail['score'] * weight:.1f}점)"
+
     def _build_explanation(self, breakdown: dict, boosters: list, total: float) -> str:
         """점수 산출 근거를 한국어 문자열로 생성.
 
         예: "국무院 발표(23.75점) + 대형 민영기업(12점) + AI산업(20점) = 총 78.5점"
         """
-        parts = []
-        weight_map = {
-            "policy_hierarchy": ("정책계층", 0.25),
-            "corporate_hierarchy": ("기업계층", 0.15),
-            "strategic_industry": ("산업전략", 0.20),
-            "economic_scale": ("경제규모", 0.15),
-            "geographic_significance": ("지리중요", 0.10),
-            "time_sensitivity": ("시간긴급", 0.05),
-            "international_impact": ("국제영향", 0.05),
-            "social_impact": ("사회파급", 0.05),
-        }
-
-        for key, (label, weight) in weight_map.items():
-            detail = breakdown[key]
-            raw = detail["score"]
-            weighted = raw * weight
-
-            if raw > 0:
-                # 상세 정보 추출
-                extra = ""
-                if "level" in detail and detail["level"]:
-                    extra = f"/{detail['level']}"
-                elif "type" in detail and detail["type"]:
-                    extra = f"/{detail['type']}"
-                elif "industry" in detail and detail["industry"]:
-                    extra = f"/{detail['industry']}"
-                elif "region" in detail and detail["region"]:
-                    extra = f"/{detail['region']}"
-
-                parts.append(f"{label}{extra}({weighted:.1f}점)")
+        parts = [
+            self._explanation_part(label, breakdown[key], weight)
+            for key, label, weight in _EXPLANATION_ITEMS
+            if breakdown[key]["score"] > 0
+        ]
 
         base_text = " + ".join(parts) if parts else "매칭 항목 없음"
 
@@ -502,7 +694,18 @@ class ContentScorer:
         return f"{base_text}{booster_text} = 총 {total:.1f}점"
 
 
+# score_news()가 공유하는 기본 인스턴스 (상태가 불변이므로 재사용)
+_default_scorer: Optional[ContentScorer] = None
+
+
+def _get_scorer() -> ContentScorer:
+    """기본 ContentScorer 인스턴스를 반환 (최초 호출 시 생성)."""
+    global _default_scorer
+    if _default_scorer is None:
+        _default_scorer = ContentScorer()
+    return _default_scorer
+
+
 def score_news(title: str, content: str, source: str = "") -> dict:
     """편의 함수: ContentScorer 인스턴스 없이 점수 계산."""
-    scorer = ContentScorer()
-    return scorer.score(title, content, source)
+    return _get_scorer().score(title, content, source)
@@ -1,14 +1,22 @@
 """News crawler implementation."""
 
+import codecs
 import logging
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from datetime import datetime
 from typing import Optional
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
 import feedparser
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import sys
 from pathlib import Path
@@ -17,15 +25,264 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 from config.settings import (
     REQUEST_HEADERS,
     REQUEST_TIMEOUT,
+    REQUEST_CONNECT_TIMEOUT,
+    REQUEST_RETRIES,
     MAX_NEWS_PER_SOURCE,
+    CRAWL_MAX_CONCURRENCY,
     INDUSTRY_KEYWORDS,
 )
+from src.collector.content_scorer import _KeywordMatcher
 from src.collector.sources import get_enabled_sources
-from src.database.models import get_connection
+from src.database.models import pool
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Keep-alive pool sizing: hosts kept alive / connections per host
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+
+# (connect, read): fail fast on dead hosts, stay patient with slow pages
+HTTP_TIMEOUT = (REQUEST_CONNECT_TIMEOUT, REQUEST_TIMEOUT)
+
+# Article URLs that failed permanently (4xx other than 408/429, or a page with
+# no extractable text) are not retried for a while, so enrich runs move past
+# them. Process-wide bounded LRU (url -> time of failure): each collector run
+# creates a new NewsCrawler, so the cache must outlive the instance.
+# Timeouts, connection errors and 5xx are transient and never cached.
+FAILED_ARTICLE_CACHE_SIZE = 1024
+FAILED_ARTICLE_RETRY_SECONDS = 6 * 3600
+_TRANSIENT_CLIENT_ERRORS = frozenset({408, 429})
+_failed_articles = OrderedDict()
+_failed_articles_lock = threading.Lock()
+
+# enrich_news_content commits fetched contents every N articles, so a crash
+# mid-run keeps what was already downloaded
+ENRICH_FLUSH_SIZE = 50
+
+# <meta charset=...> / http-equiv declaration near the top of the page
+_META_CHARSET_RE = re.compile(rb"""charset=["']?([A-Za-z0-9_-]+)""", re.IGNORECASE)
+_META_SNIFF_BYTES = 2048
+# GB2312/GBK pages routinely contain characters outside the declared set
+_GB_CHARSETS = {"gb2312", "gbk", "gb18030"}
+
+# Article URL patterns per source (precompiled: matched once per <a> tag)
+_PEOPLE_URL_RE = re.compile(r"/n\d+/\d{4}/\d{2,4}/")
+_CE_URL_RE = re.compile(r"/\d{6}/t\d{8}_\d+\.shtml")
+_STCN_URL_RE = re.compile(r"/article/|/\d{8}/|/djjd\d+/")
+_CAIXIN_URL_RE = re.compile(r"/\d{4}-\d{2}-\d{2}/\d+\.html")
+_HUXIU_URL_RE = re.compile(r"/article/\d+")
+_SHANGHAI_URL_RE = re.compile(r"/nw\d+/\d{8}/")
+_SHANGHAI_DATE_RE = re.compile(r"/(\d{4})(\d{2})(\d{2})/")
+_SHENZHEN_URL_RE = re.compile(r"/content/post_\d+\.html")
+_BEIJING_URL_RE = re.compile(r"/\d{6}/t\d{8}_\d+\.html")
+_BEIJING_DATE_RE = re.compile(r"/(\d{4})(\d{2})/t(\d{4})(\d{2})(\d{2})_")
+_CLS_URL_RE = re.compile(r"/detail/\d+")
+_JIEMIAN_URL_RE = re.compile(r"/article/\d+\.html")
+_YICAI_URL_RE = re.compile(r"/news/\d+\.html")
+_SINA_URL_RE = re.compile(r"/doc-[a-z0-9]+\.shtml")
+_21JINGJI_URL_RE = re.compile(r"/article/\d{8}/\w+/[a-f0-9]+\.html")
+_21JINGJI_DATE_RE = re.compile(r"/article/(\d{4})(\d{2})(\d{2})/")
+_CNFIN_URL_RE = re.compile(r"/detail/\d{8}/\d+_1\.html")
+_CNFIN_DATE_RE = re.compile(r"/detail/(\d{4})(\d{2})(\d{2})/")
+_BBTNEWS_URL_RE = re.compile(r"/\d{4}/\d{4}/\d+\.shtml")
+_BBTNEWS_DATE_RE = re.compile(r"/(\d{4})/(\d{2})(\d{2})/")
+_STDAILY_URL_RE = re.compile(r"/content_\d+\.html")
+_CNSTOCK_URL_RE = re.compile(r"/commonDetail/\d+")
+_CNSTOCK_NEXT_DATA_RE = re.compile(
+    r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL
+)
+_SZNEWS_URL_RE = re.compile(r"/content/\d{4}-\d{2}/\d{2}/content_\d+\.htm")
+# /YYYY-MM/DD/ (stdaily, sznews)
+_YM_D_DATE_RE = re.compile(r"/(\d{4})-(\d{2})/(\d{2})/")
+
+# cnstock relative times: '23分钟前', '7小时前', '1天前'
+_RELATIVE_TIME_RE = re.compile(r"(\d+)\s*(分钟|小时|天)前")
+_RELATIVE_TIME_UNITS = {"分钟": "minutes", "小时": "hours", "天": "days"}
+
+# is_relevant_news keyword tiers (one automaton pass per tier)
+# Exclusion: crime, accidents, disasters, social topics (checked on the title)
+_EXCLUDE_TITLE_MATCHER = _KeywordMatcher([
+    "死亡", "遇难", "火灾", "地震", "洪水", "暴雨", "塌落", "坍塌",
+    "杀人", "犯罪", "被捕", "逮捕", "判刑", "判处", "刑事", "嫌疑人",
+    "车祸", "事故", "失联", "溺水", "坠楼",
+    "社保如何", "公积金如何", "如何办理", "如何领取",
+    "体育", "娱乐", "选秀", "综艺", "明星",
+])
+# Strong: industry keywords + unambiguously economic terms, 1 match = relevant
+_STRONG_KEYWORD_MATCHER = _KeywordMatcher(
+    [kw for keywords in INDUSTRY_KEYWORDS.values() for kw in keywords] + [
+        "经济", "GDP", "产业", "金融", "财政", "货币", "利率",
+        "投资", "融资", "上市", "IPO", "股价", "债券", "基金",
+        "进出口", "贸易", "关税", "汇率", "外资", "外商",
+        "制造业", "工业增加值", "PMI", "CPI", "PPI",
+        "科创", "独角兽", "营收", "利润", "市值",
+        "房地产", "楼市", "土地出让", "保障房", "住房", "保租房",
+        "减税", "降费", "专项债", "财政赤字",
+    ]
+)
+# Weak: generic terms, need 2+ distinct matches
+_WEAK_KEYWORD_MATCHER = _KeywordMatcher([
+    "发展", "市场", "企业", "公司", "政策", "规划",
+    "创新", "科技", "技术", "数字", "智能", "绿色",
+    "高质量", "改革", "工业", "制造",
+])
+
+# Fallback published-date patterns for save_news (tried in order)
+_URL_DATE_PATTERNS = (
+    # tYYYYMMDD_XXXXXXX.html
+    (re.compile(r't(\d{4})(\d{2})(\d{2})_'), lambda m: datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))),
+    # /YYYY-MM-DD/
+    (re.compile(r'/(\d{4})-(\d{2})-(\d{2})/'), lambda m: datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))),
+    # YYYYMMDDHHMMSS as path segment
+    (re.compile(r'/(\d{4})(\d{2})(\d{2})\d{8,}/'), lambda m: datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))),
+    # /YYYYMM/ folder pattern
+    (re.compile(r'/(\d{4})(\d{2})/'), lambda m: datetime(int(m.group(1)), int(m.group(2)), 1)),
+)
+
+
+# fetch_article_content: content container selectors per source (tried in order)
+_SITE_ARTICLE_SELECTORS = {
+    "people": ["div.rm_txt_con", "div.content", "div.article"],
+    "ce": ["div.TRS_Editor", "div.content", "div.article"],
+    "stcn": ["div.txt_content", "div.article-content", "article"],
+    "caixin": ["div#Main_Content_Val", "div.article-content", "article"],
+    "huxiu": ["div.article-content-wrap", "div.article__content", "article"],
+    "36kr": ["div.article-content", "div.content", "article"],
+    "shanghai_gov": ["div.Article_content", "div.article-con", "div.zwgk-text", "div.content"],
+    "shenzhen_gov": ["div.news_cont_d_wrap", "div.zwgk-text", "div.article-content", "div.content"],
+    "beijing_gov": ["div.view TRS_UEDITOR", "div.xl_news", "div.article-content", "div.content"],
+    "cls": ["div.detail-content", "div.article-content", "article"],
+    "jiemian": ["div.article-content", "div.article-main", "article"],
+    "yicai": ["div.m-text", "div.article-content", "article"],
+    "sina_finance": ["div.article-content-left", "div#artibody", "div.article"],
+    "21jingji": ["div.article-content", "div.txtContent", "article"],
+    "xinhua_finance": ["div.detail-content", "div.article-content", "article"],
+    # Week 6 지방 언론
+    "bbtnews": ["div.article-content", "div.content", "article"],
+    "stdaily": ["div.content_area", "div.article-content", "div.content", "article"],
+    "cnstock": ["div.article-content", "div.content", "article"],
+    "sznews": ["div.article-content", "div.content", "article"],
+}
+_DEFAULT_ARTICLE_SELECTORS = (
+    "div.article-content",
+    "div.content",
+    "div.article",
+    "div#content",
+    "article",
+    "div.text",
+    "div.detail",
+)
+# Site selectors + defaults, duplicates dropped (a repeated selector finds the same node)
+_ARTICLE_SELECTORS = {
+    source: tuple(dict.fromkeys([*selectors, *_DEFAULT_ARTICLE_SELECTORS]))
+    for source, selectors in _SITE_ARTICLE_SELECTORS.items()
+}
+
+# List-page containers for the crawlers that select <li> rather than <a>
+# (class regex rather than a list: a list misses multi-class <ul class="tadaty-list x">)
+_SHANGHAI_LISTS = SoupStrainer(
+    "ul", class_=re.compile(r"(?:^|\s)(?:tadaty-list|list-date)(?:\s|$)")
+)
+_LIST_ITEMS = SoupStrainer("li")
+# Opening tag of the first shanghai news list: everything before it (head,
+# header navigation, banners) cannot contain list items and is not parsed
+_SHANGHAI_LIST_START_RE = re.compile(
+    r"""<ul\b[^>]*\bclass=["']?[^"'>]*\b(?:tadaty-list|list-date)\b""", re.IGNORECASE
+)
+
+# Root-relative ("/path") or protocol-relative ("//host/path") href that urljoin
+# would only concatenate: no dot or empty segments, ;params, whitespace,
+# brackets, or empty query/fragment markers
+_SIMPLE_HREF_RE = re.compile(r"(?://[A-Za-z0-9]|/(?![/.]))(?!.*(?:/\.|//|[;\s\\\[\]]|\?#|[?#]$))", re.DOTALL)
+
+
+@lru_cache(maxsize=128)
+def _url_origin(url: str) -> tuple[str, str]:
+    """(scheme, "scheme://netloc") of a page URL."""
+    parts = urlsplit(url)
+    return parts.scheme, f"{parts.scheme}://{parts.netloc}"
+
+
+def _join_url(page_url: str, href: str) -> str:
+    """urljoin(page_url, href) with a concatenation fast path.
+
+    Root-relative ("/path") and protocol-relative ("//host/path") hrefs are
+    joined by prefixing the page origin / scheme; anything urljoin would
+    normalize goes through urljoin itself.
+    """
+    if _SIMPLE_HREF_RE.match(href):
+        scheme, origin = _url_origin(page_url)
+        if href.startswith("//"):
+            return f"{scheme}:{href}"
+        return origin + href
+    return urljoin(page_url, href)
+
+
+def _parse_links(html: str, href, token: Optional[str] = None) -> BeautifulSoup:
+    """Parse a listing page keeping only the <a> tags selected by href.
+
+    If the page does not contain token at all (defaults to href when it is a
+    plain substring), no link can match: skip the parse and return an empty
+    soup.
+    """
+    if token is None and isinstance(href, str):
+        token = href
+    if token and token not in html:
+        return BeautifulSoup("", "lxml")
+    return BeautifulSoup(html, "lxml", parse_only=_link_strainer(href))
+
+
+def _link_strainer(href) -> SoupStrainer:
+    """Parse only <a> tags whose href contains href (str) or matches it (regex).
+
+    Listing pages are mostly navigation and non-article links; filtering at
+    parse time means BeautifulSoup never builds Tag objects for them.
+    """
+    if isinstance(href, str):
+        href = re.compile(re.escape(href))
+    return SoupStrainer("a", href=href)
+
+
+def _remember_failed_article(url: str):
+    """Record a permanent article fetch failure (LRU, bounded)."""
+    with _failed_articles_lock:
+        _failed_articles[url] = time.monotonic()
+        _failed_articles.move_to_end(url)
+        while len(_failed_articles) > FAILED_ARTICLE_CACHE_SIZE:
+            _failed_articles.popitem(last=False)
+
+
+def _forget_failed_article(url: str):
+    """Drop url from the failed-article cache after a successful fetch."""
+    with _failed_articles_lock:
+        _failed_articles.pop(url, None)
+
+
+def _recently_failed(url: str) -> bool:
+    """True if url failed permanently within FAILED_ARTICLE_RETRY_SECONDS."""
+    with _failed_articles_lock:
+        failed_at = _failed_articles.get(url)
+        if failed_at is None:
+            return False
+        if time.monotonic() - failed_at < FAILED_ARTICLE_RETRY_SECONDS:
+            return True
+        del _failed_articles[url]
+        return False
+
+
+def _failed_article_count() -> int:
+    """Number of URLs currently in the failed-article cache."""
+    with _failed_articles_lock:
+        return len(_failed_articles)
+
+
+INSERT_NEWS_SQL = """
+    INSERT OR IGNORE INTO news
+    (source, original_url, original_title, original_content, published_at, collected_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
 
 class NewsCrawler:
     """News crawler for Chinese economic news sources."""
@@ -33,22 +290,95 @@ class NewsCrawler:
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update(REQUEST_HEADERS)
+        # One pooled adapter for every crawl_* / article fetch: section pages and
+        # articles on the same host reuse the TCP/TLS connection
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=REQUEST_RETRIES,
+                backoff_factor=0.3,
+                status_forcelist=(500, 502, 503, 504),
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def fetch_url(self, url: str) -> Optional[str]:
         """Fetch URL content."""
+        return self._download(url)[0]
+
+    def _download(self, url: str) -> tuple[Optional[str], bool]:
+        """Fetch URL content as (text, permanent_failure).
+
+        permanent_failure is True only for client errors that retrying will not
+        fix (4xx except 408/429); text is None on any failure.
+        """
         try:
-            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            response = self.session.get(url, timeout=HTTP_TIMEOUT)
             response.raise_for_status()
-            response.encoding = response.apparent_encoding or "utf-8"
-            return response.text
+            response.encoding = self._response_encoding(response)
+            return response.text, False
         except requests.RequestException as e:
             logger.error(f"Failed to fetch {url}: {e}")
-            return None
+            status = e.response.status_code if e.response is not None else None
+            permanent = (
+                status is not None and 400 <= status < 500
+                and status not in _TRANSIENT_CLIENT_ERRORS
+            )
+            return None, permanent
+
+    @staticmethod
+    def _response_encoding(response: requests.Response) -> str:
+        """Pick the page encoding from Content-Type or <meta charset>.
+
+        Falls back to content sniffing (apparent_encoding) only when neither
+        declares a usable charset, since sniffing scans the whole body.
+        """
+        encoding = None
+        if "charset" in response.headers.get("Content-Type", "").lower():
+            encoding = response.encoding
+        else:
+            match = _META_CHARSET_RE.search(response.content[:_META_SNIFF_BYTES])
+            if match:
+                encoding = match.group(1).decode("ascii")
+
+        if encoding:
+            if encoding.lower() in _GB_CHARSETS:
+                return "gb18030"
+            try:
+                codecs.lookup(encoding)
+                return encoding
+            except LookupError:
+                pass
+
+        return response.apparent_encoding or "utf-8"
+
+    def fetch_urls(self, urls: list[str]) -> list[Optional[str]]:
+        """Fetch several URLs concurrently; results keep the order of urls."""
+        if len(urls) <= 1:
+            return [self.fetch_url(url) for url in urls]
+        with ThreadPoolExecutor(max_workers=min(len(urls), CRAWL_MAX_CONCURRENCY)) as executor:
+            return list(executor.map(self.fetch_url, urls))
 
     def parse_rss(self, rss_url: str, source_key: str) -> list[dict]:
-        """Parse RSS feed and return news items."""
-        feed = feedparser.parse(rss_url)
+        """Parse RSS feed and return news items.
+
+        The feed is downloaded through the pooled session (headers, timeout,
+        keep-alive) and feedparser only parses the bytes; crawl_all runs the
+        feeds concurrently with the other sources.
+        """
+        try:
+            response = self.session.get(rss_url, timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch {rss_url}: {e}")
+            return []
+
+        # Raw bytes: feedparser resolves the encoding from the XML declaration
+        feed = feedparser.parse(response.content)
         items = []
+        seen_urls = set()
 
         for entry in feed.entries[:MAX_NEWS_PER_SOURCE]:
             item = {
@@ -58,7 +388,8 @@ class NewsCrawler:
                 "original_content": entry.get("summary", ""),
                 "published_at": self._parse_date(entry.get("published")),
             }
-            if item["original_url"] and item["original_title"]:
+            if item["original_url"] and item["original_title"] and item["original_url"] not in seen_urls:
+                seen_urls.add(item["original_url"])
                 items.append(item)
 
         return items
@@ -66,22 +397,26 @@ class NewsCrawler:
     def crawl_people(self) -> list[dict]:
         """Crawl People's Daily Finance (인민일보 재경)."""
         items = []
+        seen_urls = set()
         url = "http://finance.people.com.cn/"
         html = self.fetch_url(url)
         if not html:
             return items
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = _parse_links(html, "people.com.cn")
         for link in soup.select("a[href*='people.com.cn']")[:MAX_NEWS_PER_SOURCE * 2]:
             href = link.get("href", "")
             title = link.get_text(strip=True)
 
-            if not href or not title or len(title) < 10:
+            if not href or len(title) < 10:
                 continue
             if not href.startswith("http"):
-                href = urljoin(url, href)
+                href = _join_url(url, href)
+            if href in seen_urls:
+                continue
             # Match patterns like /n1/2025/0125/ or /n1/2024/1230/
-            if re.search(r"/n\d+/\d{4}/\d{2,4}/", href) and ".htm" in href:
+            if ".htm" in href and _PEOPLE_URL_RE.search(href):
+                seen_urls.add(href)
                 items.append({
                     "source": "people",
                     "original_url": href,
@@ -95,26 +430,30 @@ class NewsCrawler:
     def crawl_ce(self) -> list[dict]:
         """Crawl China Economic Daily (경제일보)."""
         items = []
+        seen_urls = set()
         url = "http://www.ce.cn/"
         try:
-            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            response = self.session.get(url, timeout=HTTP_TIMEOUT)
             response.encoding = "utf-8"
             html = response.text
         except requests.RequestException as e:
             logger.error(f"Failed to fetch {url}: {e}")
             return items
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = _parse_links(html, ".ce.cn")
         for link in soup.select("a[href*='.ce.cn']")[:MAX_NEWS_PER_SOURCE * 2]:
             href = link.get("href", "")
             title = link.get_text(strip=True)
 
-            if not href or not title or len(title) < 5:
+            if not href or len(title) < 5:
                 continue
             if not href.startswith("http"):
-                href = urljoin(url, href)
+                href = _join_url(url, href)
+            if href in seen_urls:
+                continue
             # Match patterns like /202601/t20260123_2723689.shtml
-            if re.search(r"/\d{6}/t\d{8}_\d+\.shtml", href):
+            if _CE_URL_RE.search(href):
+                seen_urls.add(href)
                 items.append({
                     "source": "ce",
                     "original_url": href,
@@ -128,24 +467,26 @@ class NewsCrawler:
     def crawl_stcn(self) -> list[dict]:
         """Crawl Securities Times (증권시보)."""
         items = []
+        seen_urls = set()
         url = "https://www.stcn.com/"
         html = self.fetch_url(url)
         if not html:
             return items
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = _parse_links(html, "stcn.com")
         for link in soup.select("a[href*='stcn.com']")[:MAX_NEWS_PER_SOURCE * 2]:
             href = link.get("href", "")
             title = link.get_text(strip=True)
 
-            if not href or not title or len(title) < 10:
+            if not href or len(title) < 10:
                 continue
             if not href.startswith("http"):
-                href = urljoin(url, href)
+                href = _join_url(url, href)
+            if href in seen_urls:
+                continue
             # Match article URLs with date patterns
-            if (re.search(r"/article/", href) or
-                re.search(r"/\d{8}/", href) or
-                re.search(r"/djjd\d+/", href)):
+            if _STCN_URL_RE.search(href):
+                seen_urls.add(href)
                 items.append({
                     "source": "stcn",
                     "original_url": href,
@@ -168,24 +509,23 @@ class NewsCrawler:
             "https://www.caixin.com/business/",
         ]
 
-        for section_url in sections:
-            html = self.fetch_url(section_url)
+        for section_url, html in zip(sections, self.fetch_urls(sections)):
             if not html:
                 continue
 
-            soup = BeautifulSoup(html, "lxml")
+            soup = _parse_links(html, _CAIXIN_URL_RE, ".html")
 
             for link in soup.select("a"):
                 href = link.get("href", "")
                 title = link.get_text(strip=True)
 
-                if not href or not title or len(title) < 10:
+                if not href or len(title) < 10:
                     continue
                 if href in seen_urls:
                     continue
 
                 # Match article URLs: /2026-01-26/xxxxx.html
-                if re.search(r"/\d{4}-\d{2}-\d{2}/\d+\.html", href):
+                if _CAIXIN_URL_RE.search(href):
                     seen_urls.add(href)
                     items.append({
                         "source": "caixin",
@@ -203,25 +543,29 @@ class NewsCrawler:
     def crawl_huxiu(self) -> list[dict]:
         """Crawl Huxiu (후시우) - Tech media."""
         items = []
+        seen_urls = set()
         url = "https://www.huxiu.com/"
         html = self.fetch_url(url)
         if not html:
             return items
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = _parse_links(html, "huxiu.com/article")
 
         # Huxiu article links pattern
         for link in soup.select("a[href*='huxiu.com/article']")[:MAX_NEWS_PER_SOURCE * 2]:
             href = link.get("href", "")
             title = link.get_text(strip=True)
 
-            if not href or not title or len(title) < 8:
+            if not href or len(title) < 8:
                 continue
             if not href.startswith("http"):
-                href = urljoin(url, href)
+                href = _join_url(url, href)
+            if href in seen_urls:
+                continue
 
             # Match article URLs: /article/xxxxx.html
-            if re.search(r"/article/\d+", href):
+            if _HUXIU_URL_RE.search(href):
+                seen_urls.add(href)
                 items.append({
                     "source": "huxiu",
                     "original_url": href,
@@ -244,13 +588,16 @@ class NewsCrawler:
             "/nw4411/index.html",   # 정책문건 (Policy Documents)
         ]
 
-        for page in pages:
-            url = base_url + page
-            html = self.fetch_url(url)
+        urls = [base_url + page for page in pages]
+        for url, html in zip(urls, self.fetch_urls(urls)):
             if not html:
                 continue
 
-            soup = BeautifulSoup(html, "lxml")
+            # Only the two news list containers are parsed, starting at the first one
+            list_start = _SHANGHAI_LIST_START_RE.search(html)
+            if list_start:
+                html = html[list_start.start():]
+            soup = BeautifulSoup(html, "lxml", parse_only=_SHANGHAI_LISTS)
 
             # Find news list items
             for li in soup.select("ul.tadaty-list li, ul.list-date li"):
@@ -261,12 +608,12 @@ class NewsCrawler:
                 href = link.get("href", "")
                 title = link.get("title") or link.get_text(strip=True)
 
-                if not href or not title or len(title) < 8:
+                if not href or len(title) < 8:
                     continue
 
                 # Build full URL
                 if not href.startswith("http"):
-                    href = urljoin(base_url, href)
+                    href = _join_url(base_url, href)
 
                 # Skip duplicates
                 if href in seen_urls:
@@ -274,9 +621,9 @@ class NewsCrawler:
                 seen_urls.add(href)
 
                 # Match Shanghai gov article patterns
-                if re.search(r"/nw\d+/\d{8}/", href) and ".html" in href:
+                if ".html" in href and _SHANGHAI_URL_RE.search(href):
                     # Parse date from URL if possible
-                    date_match = re.search(r"/(\d{4})(\d{2})(\d{2})/", href)
+                    date_match = _SHANGHAI_DATE_RE.search(href)
                     published_at = None
                     if date_match:
                         try:
@@ -312,7 +659,7 @@ class NewsCrawler:
         if not html:
             return items
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = _parse_links(html, "content/post_")
 
         # Non-news URL patterns to skip (department pages, org charts, etc.)
         shenzhen_skip_patterns = ["/jgzn/", "/nsjg/", "/zsjg/", "/ldjs/"]
@@ -323,14 +670,14 @@ class NewsCrawler:
             title = link.get("title") or link.get_text(strip=True)
 
             # Skip non-news links
-            if not href or not title or len(title) < 8:
+            if not href or len(title) < 8:
                 continue
             if title in ["查看详情", "业务咨询"]:
                 continue
 
             # Build full URL (force HTTP: HTTPS is broken on this server)
             if not href.startswith("http"):
-                href = urljoin(base_url, href)
+                href = _join_url(base_url, href)
             href = href.replace("https://gxj.sz.gov.cn", "http://gxj.sz.gov.cn")
 
             # Skip department/org pages (not news)
@@ -343,7 +690,7 @@ class NewsCrawler:
             seen_urls.add(href)
 
             # Match Shenzhen gov article patterns
-            if re.search(r"/content/post_\d+\.html", href):
+            if _SHENZHEN_URL_RE.search(href):
                 items.append({
                     "source": "shenzhen_gov",
                     "original_url": href,
@@ -360,20 +707,21 @@ class NewsCrawler:
         policy_url = "http://gxj.sz.gov.cn/xxgk/xxgkml/zcfgjzcjd/gfxwjcx/index.html"
         html = self.fetch_url(policy_url)
         if html:
-            soup = BeautifulSoup(html, "lxml")
+            soup = _parse_links(html, "content/post_")
             for link in soup.select("a[href*='content/post_']"):
                 href = link.get("href", "")
                 title = link.get("title") or link.get_text(strip=True)
 
-                if not href or not title or len(title) < 8:
-                    continue
-                if href in seen_urls:
+                if not href or len(title) < 8:
                     continue
 
                 if not href.startswith("http"):
-                    href = urljoin(base_url, href)
+                    href = _join_url(base_url, href)
                 href = href.replace("https://gxj.sz.gov.cn", "http://gxj.sz.gov.cn")
 
+                # Compare normalized URLs: the main page loop stores them that way
+                if href in seen_urls:
+                    continue
                 seen_urls.add(href)
                 items.append({
                     "source": "shenzhen_gov",
@@ -400,7 +748,7 @@ class NewsCrawler:
         if not html:
             return items
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, "lxml", parse_only=_LIST_ITEMS)
 
         # Find policy links in list items
         for li in soup.select("li"):
@@ -411,7 +759,7 @@ class NewsCrawler:
             href = link.get("href", "")
             title = link.get("title") or link.get_text(strip=True)
 
-            if not href or not title or len(title) < 10:
+            if not href or len(title) < 10:
                 continue
 
             # Build full URL
@@ -420,7 +768,7 @@ class NewsCrawler:
             elif href.startswith("/"):
                 href = base_url + href
             elif not href.startswith("http"):
-                href = urljoin(policy_url, href)
+                href = _join_url(policy_url, href)
 
             # Skip duplicates
             if href in seen_urls:
@@ -428,9 +776,9 @@ class NewsCrawler:
             seen_urls.add(href)
 
             # Match Beijing gov article patterns
-            if re.search(r"/\d{6}/t\d{8}_\d+\.html", href):
+            if _BEIJING_URL_RE.search(href):
                 # Parse date from URL
-                date_match = re.search(r"/(\d{4})(\d{2})/t(\d{4})(\d{2})(\d{2})_", href)
+                date_match = _BEIJING_DATE_RE.search(href)
                 published_at = None
                 if date_match:
                     try:
@@ -463,21 +811,21 @@ class NewsCrawler:
         if not html:
             return items
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = _parse_links(html, "/detail/")
         seen_urls = set()
 
         for link in soup.select("a[href*='/detail/']")[:MAX_NEWS_PER_SOURCE * 2]:
             href = link.get("href", "")
             title = link.get_text(strip=True)
 
-            if not href or not title or len(title) < 10:
+            if not href or len(title) < 10:
                 continue
             if not href.startswith("http"):
-                href = urljoin(url, href)
+                href = _join_url(url, href)
             if href in seen_urls:
                 continue
 
-            if re.search(r"/detail/\d+", href):
+            if _CLS_URL_RE.search(href):
                 seen_urls.add(href)
                 items.append({
                     "source": "cls",
@@ -500,21 +848,21 @@ class NewsCrawler:
         if not html:
             return items
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = _parse_links(html, "/article/")
         seen_urls = set()
 
         for link in soup.select("a[href*='/article/']")[:MAX_NEWS_PER_SOURCE * 2]:
             href = link.get("href", "")
             title = link.get_text(strip=True)
 
-            if not href or not title or len(title) < 10:
+            if not href or len(title) < 10:
                 continue
             if not href.startswith("http"):
-                href = urljoin(url, href)
+                href = _join_url(url, href)
             if href in seen_urls:
                 continue
 
-            if re.search(r"/article/\d+\.html", href):
+            if _JIEMIAN_URL_RE.search(href):
                 seen_urls.add(href)
                 items.append({
                     "source": "jiemian",
@@ -537,21 +885,21 @@ class NewsCrawler:
         if not html:
             return items
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = _parse_links(html, "/news/")
         seen_urls = set()
 
         for link in soup.select("a[href*='/news/']")[:MAX_NEWS_PER_SOURCE * 2]:
             href = link.get("href", "")
             title = link.get_text(strip=True)
 
-            if not href or not title or len(title) < 10:
+            if not href or len(title) < 10:
                 continue
             if not href.startswith("http"):
-                href = urljoin(url, href)
+                href = _join_url(url, href)
             if href in seen_urls:
                 continue
 
-            if re.search(r"/news/\d+\.html", href):
+            if _YICAI_URL_RE.search(href):
                 seen_urls.add(href)
                 items.append({
                     "source": "yicai",
@@ -574,7 +922,7 @@ class NewsCrawler:
         if not html:
             return items
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = _parse_links(html, _SINA_URL_RE, "/doc-")
         seen_urls = set()
 
         # Links can be absolute or relative paths with doc-xxx.shtml pattern
@@ -582,15 +930,15 @@ class NewsCrawler:
             href = link.get("href", "")
             title = link.get_text(strip=True)
 
-            if not href or not title or len(title) < 10:
+            if not href or len(title) < 10:
                 continue
 
             # Match doc-xxx.shtml pattern
-            if not re.search(r"/doc-[a-z0-9]+\.shtml", href):
+            if not _SINA_URL_RE.search(href):
                 continue
 
             if not href.startswith("http"):
-                href = urljoin(url, href)
+                href = _join_url(url, href)
             if href in seen_urls:
                 continue
 
@@ -616,25 +964,25 @@ class NewsCrawler:
         if not html:
             return items
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = _parse_links(html, "/article/")
         seen_urls = set()
 
         for link in soup.select("a[href*='/article/']")[:MAX_NEWS_PER_SOURCE * 2]:
             href = link.get("href", "")
             title = link.get("title") or link.get_text(strip=True)
 
-            if not href or not title or len(title) < 10:
+            if not href or len(title) < 10:
                 continue
             if not href.startswith("http"):
-                href = urljoin(url, href)
+                href = _join_url(url, href)
             if href in seen_urls:
                 continue
 
             # Match /article/YYYYMMDD/section/hash.html
-            if re.search(r"/article/\d{8}/\w+/[a-f0-9]+\.html", href):
+            if _21JINGJI_URL_RE.search(href):
                 seen_urls.add(href)
                 # Parse date from URL
-                date_match = re.search(r"/article/(\d{4})(\d{2})(\d{2})/", href)
+                date_match = _21JINGJI_DATE_RE.search(href)
                 published_at = None
                 if date_match:
                     try:
@@ -667,7 +1015,7 @@ class NewsCrawler:
         if not html:
             return items
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = _parse_links(html, _CNFIN_URL_RE, "_1.html")
         seen_urls = set()
 
         # Links are protocol-relative: //www.cnfin.com/yw-lb/detail/...
@@ -675,23 +1023,23 @@ class NewsCrawler:
             href = link.get("href", "")
             title = link.get_text(strip=True)
 
-            if not href or not title or len(title) < 10:
+            if not href or len(title) < 10:
                 continue
 
             # Match /detail/YYYYMMDD/id_1.html pattern
-            if not re.search(r"/detail/\d{8}/\d+_1\.html", href):
+            if not _CNFIN_URL_RE.search(href):
                 continue
 
             if href.startswith("//"):
                 href = "https:" + href
             elif not href.startswith("http"):
-                href = urljoin(url, href)
+                href = _join_url(url, href)
             if href in seen_urls:
                 continue
 
             seen_urls.add(href)
             # Parse date from URL
-            date_match = re.search(r"/detail/(\d{4})(\d{2})(\d{2})/", href)
+            date_match = _CNFIN_DATE_RE.search(href)
             published_at = None
             if date_match:
                 try:
@@ -732,32 +1080,31 @@ class NewsCrawler:
             "http://www.bbtnews.com.cn/finance/",
         ]
 
-        for page_url in pages:
-            html = self.fetch_url(page_url)
+        for page_url, html in zip(pages, self.fetch_urls(pages)):
             if not html:
                 continue
 
-            soup = BeautifulSoup(html, "lxml")
+            soup = _parse_links(html, _BBTNEWS_URL_RE, ".shtml")
 
             for link in soup.select("a"):
                 href = link.get("href", "")
                 title = link.get_text(strip=True)
 
-                if not href or not title or len(title) < 10:
+                if not href or len(title) < 10:
                     continue
 
                 # URL pattern: /YYYY/MMDD/######.shtml
-                if not re.search(r"/\d{4}/\d{4}/\d+\.shtml", href):
+                if not _BBTNEWS_URL_RE.search(href):
                     continue
 
                 if not href.startswith("http"):
-                    href = urljoin(page_url, href)
+                    href = _join_url(page_url, href)
                 if href in seen_urls:
                     continue
                 seen_urls.add(href)
 
                 # Parse date from URL: /YYYY/MMDD/
-                date_match = re.search(r"/(\d{4})/(\d{2})(\d{2})/", href)
+                date_match = _BBTNEWS_DATE_RE.search(href)
                 published_at = None
                 if date_match:
                     try:
@@ -792,27 +1139,27 @@ class NewsCrawler:
         if not html:
             return items
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = _parse_links(html, _STDAILY_URL_RE, "/content_")
 
         for link in soup.select("a"):
             href = link.get("href", "")
             title = link.get_text(strip=True)
 
-            if not href or not title or len(title) < 10:
+            if not href or len(title) < 10:
                 continue
 
             # URL pattern: /web/[section/]YYYY-MM/DD/content_######.html
-            if not re.search(r"/content_\d+\.html", href):
+            if not _STDAILY_URL_RE.search(href):
                 continue
 
             if not href.startswith("http"):
-                href = urljoin(base_url, href)
+                href = _join_url(base_url, href)
             if href in seen_urls:
                 continue
             seen_urls.add(href)
 
             # Parse date from URL: /YYYY-MM/DD/
-            date_match = re.search(r"/(\d{4})-(\d{2})/(\d{2})/", href)
+            date_match = _YM_D_DATE_RE.search(href)
             published_at = None
             if date_match:
                 try:
@@ -854,9 +1201,7 @@ class NewsCrawler:
             return items
 
         # Extract articles from __NEXT_DATA__ JSON
-        next_data_match = re.search(
-            r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', html, re.DOTALL
-        )
+        next_data_match = _CNSTOCK_NEXT_DATA_RE.search(html)
         if not next_data_match:
             # Fallback to HTML parsing
             return self._crawl_cnstock_html(html, base_url)
@@ -906,17 +1251,17 @@ class NewsCrawler:
         """Fallback HTML-based cnstock crawling."""
         items = []
         seen_urls = set()
-        soup = BeautifulSoup(html, "lxml")
+        soup = _parse_links(html, _CNSTOCK_URL_RE, "/commonDetail/")
 
         for link in soup.select("a"):
             href = link.get("href", "")
             title = link.get_text(strip=True)
-            if not href or not title or len(title) < 10:
+            if not href or len(title) < 10:
                 continue
-            if not re.search(r"/commonDetail/\d+", href):
+            if not _CNSTOCK_URL_RE.search(href):
                 continue
             if not href.startswith("http"):
-                href = urljoin(base_url, href)
+                href = _join_url(base_url, href)
             if href in seen_urls:
                 continue
             seen_urls.add(href)
@@ -944,15 +1289,9 @@ class NewsCrawler:
             return now
 
         # Relative: '7小时前', '23分钟前', '1天前'
-        m = re.match(r'(\d+)\s*分钟前', time_str)
+        m = _RELATIVE_TIME_RE.match(time_str)
         if m:
-            return now - timedelta(minutes=int(m.group(1)))
-        m = re.match(r'(\d+)\s*小时前', time_str)
-        if m:
-            return now - timedelta(hours=int(m.group(1)))
-        m = re.match(r'(\d+)\s*天前', time_str)
-        if m:
-            return now - timedelta(days=int(m.group(1)))
+            return now - timedelta(**{_RELATIVE_TIME_UNITS[m.group(2)]: int(m.group(1))})
 
         # Absolute: '2026-01-30' or '2026-01-30 09:35'
         for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d"):
@@ -973,27 +1312,27 @@ class NewsCrawler:
         if not html:
             return items
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = _parse_links(html, _SZNEWS_URL_RE, "/content_")
 
         for link in soup.select("a"):
             href = link.get("href", "")
             title = link.get_text(strip=True)
 
-            if not href or not title or len(title) < 10:
+            if not href or len(title) < 10:
                 continue
 
             # URL pattern: /news/content/YYYY-MM/DD/content_######.htm
-            if not re.search(r"/content/\d{4}-\d{2}/\d{2}/content_\d+\.htm", href):
+            if not _SZNEWS_URL_RE.search(href):
                 continue
 
             if not href.startswith("http"):
-                href = urljoin(base_url, href)
+                href = _join_url(base_url, href)
             if href in seen_urls:
                 continue
             seen_urls.add(href)
 
             # Parse date from URL: /YYYY-MM/DD/
-            date_match = re.search(r"/(\d{4})-(\d{2})/(\d{2})/", href)
+            date_match = _YM_D_DATE_RE.search(href)
             published_at = None
             if date_match:
                 try:
@@ -1021,6 +1360,9 @@ class NewsCrawler:
     def fetch_article_content(self, url: str, source: str = "") -> Optional[str]:
         """Fetch full article content from URL.
 
+        URLs that failed permanently within FAILED_ARTICLE_RETRY_SECONDS return
+        None without being downloaded again.
+
         Args:
             url: Article URL
             source: Source key for site-specific parsing
@@ -1028,54 +1370,39 @@ class NewsCrawler:
         Returns:
             Article content text or None
         """
-        html = self.fetch_url(url)
+        if _recently_failed(url):
+            return None
+
+        html, permanent_failure = self._download(url)
         if not html:
+            # Transient failures (timeout, 5xx, 429) are retried on the next run
+            if permanent_failure:
+                _remember_failed_article(url)
             return None
 
+        content = self._extract_article_content(html, url, source)
+
+        # A page that downloads but yields no article text will not change soon
+        if content:
+            _forget_failed_article(url)
+        else:
+            _remember_failed_article(url)
+        return content
+
+    def _extract_article_content(self, html: str, url: str, source: str) -> Optional[str]:
+        """Extract the article text from a downloaded page (see fetch_article_content)."""
         soup = BeautifulSoup(html, "lxml")
 
-        # Site-specific selectors
-        site_selectors = {
-            "people": ["div.rm_txt_con", "div.content", "div.article"],
-            "ce": ["div.TRS_Editor", "div.content", "div.article"],
-            "stcn": ["div.txt_content", "div.article-content", "article"],
-            "caixin": ["div#Main_Content_Val", "div.article-content", "article"],
-            "huxiu": ["div.article-content-wrap", "div.article__content", "article"],
-            "36kr": ["div.article-content", "div.content", "article"],
-            "shanghai_gov": ["div.Article_content", "div.article-con", "div.zwgk-text", "div.content"],
-            "shenzhen_gov": ["div.news_cont_d_wrap", "div.zwgk-text", "div.article-content", "div.content"],
-            "beijing_gov": ["div.view TRS_UEDITOR", "div.xl_news", "div.article-content", "div.content"],
-            "cls": ["div.detail-content", "div.article-content", "article"],
-            "jiemian": ["div.article-content", "div.article-main", "article"],
-            "yicai": ["div.m-text", "div.article-content", "article"],
-            "sina_finance": ["div.article-content-left", "div#artibody", "div.article"],
-            "21jingji": ["div.article-content", "div.txtContent", "article"],
-            "xinhua_finance": ["div.detail-content", "div.article-content", "article"],
-            # Week 6 지방 언론
-            "bbtnews": ["div.article-content", "div.content", "article"],
-            "stdaily": ["div.content_area", "div.article-content", "div.content", "article"],
-            "cnstock": ["div.article-content", "div.content", "article"],
-            "sznews": ["div.article-content", "div.content", "article"],
-        }
-
-        # Get selectors for this source or use defaults
-        selectors = site_selectors.get(source, [])
-        selectors.extend([
-            "div.article-content",
-            "div.content",
-            "div.article",
-            "div#content",
-            "article",
-            "div.text",
-            "div.detail",
-        ])
+        # Site-specific selectors first, then generic fallbacks
+        selectors = _ARTICLE_SELECTORS.get(source, _DEFAULT_ARTICLE_SELECTORS)
 
         for selector in selectors:
             content_div = soup.select_one(selector)
             if content_div:
-                # Remove unwanted elements
+                # Remove unwanted elements (extract: detaching is enough, the
+                # soup is discarded after this call so no need to decompose)
                 for tag in content_div.find_all(["script", "style", "nav", "footer", "aside"]):
-                    tag.decompose()
+                    tag.extract()
                 text = content_div.get_text(separator="\n", strip=True)
                 if len(text) > 100:
                     return text[:10000]  # Limit to 10k chars
@@ -1105,43 +1432,61 @@ class NewsCrawler:
     def enrich_news_content(self, limit: int = 10) -> int:
         """Fetch full content for news items missing content.
 
+        Articles are fetched concurrently (CRAWL_MAX_CONCURRENCY workers) and
+        the contents are written with executemany, one transaction per
+        ENRICH_FLUSH_SIZE articles.
+
         Args:
             limit: Maximum number of items to enrich
 
         Returns:
             Number of items enriched
         """
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        # Get news items without content
-        cursor.execute("""
-            SELECT id, source, original_url FROM news
-            WHERE (original_content IS NULL OR original_content = '')
-            ORDER BY collected_at DESC
-            LIMIT ?
-        """, (limit,))
-
-        items = cursor.fetchall()
+        # Get news items without content; over-select by the number of recently
+        # failed URLs so they do not keep occupying the batch
+        with pool.reader() as conn:
+            rows = conn.execute("""
+                SELECT id, source, original_url FROM news
+                WHERE (original_content IS NULL OR original_content = '')
+                ORDER BY collected_at DESC
+                LIMIT ?
+            """, (limit + _failed_article_count(),)).fetchall()
+        items = [row for row in rows if not _recently_failed(row["original_url"])][:limit]
+
+        if not items:
+            return 0
+
+        logger.info(f"Fetching content for {len(items)} news...")
         enriched = 0
+        updates = []
+
+        def flush():
+            nonlocal enriched
+            if updates:
+                with pool.writer() as conn:
+                    conn.executemany("""
+                        UPDATE news SET original_content = ?, updated_at = ?
+                        WHERE id = ?
+                    """, updates)
+                enriched += len(updates)
+                updates.clear()
+
+        with ThreadPoolExecutor(max_workers=CRAWL_MAX_CONCURRENCY) as executor:
+            contents = executor.map(
+                self.fetch_article_content,
+                [item["original_url"] for item in items],
+                [item["source"] for item in items],
+            )
+            for item, content in zip(items, contents):
+                if content:
+                    updates.append((content, datetime.now(), item["id"]))
+                    logger.info(f"  News {item['id']}: content fetched ({len(content)} chars)")
+                    if len(updates) >= ENRICH_FLUSH_SIZE:
+                        flush()
+                else:
+                    logger.warning(f"  News {item['id']}: failed to fetch content")
 
-        for item in items:
-            news_id, source, url = item["id"], item["source"], item["original_url"]
-            logger.info(f"Fetching content for news {news_id}...")
-
-            content = self.fetch_article_content(url, source)
-            if content:
-                cursor.execute("""
-                    UPDATE news SET original_content = ?, updated_at = ?
-                    WHERE id = ?
-                """, (content, datetime.now(), news_id))
-                enriched += 1
-                logger.info(f"  Content fetched: {len(content)} chars")
-            else:
-                logger.warning(f"  Failed to fetch content")
-
-        conn.commit()
-        conn.close()
+        flush()
         return enriched
 
     def is_relevant_news(self, title: str, content: str = "") -> bool:
@@ -1155,49 +1500,15 @@ class NewsCrawler:
         text = f"{title} {content}"
 
         # Exclusion: reject titles about crime, accidents, disasters, social topics
-        exclude_patterns = [
-            "死亡", "遇难", "火灾", "地震", "洪水", "暴雨", "塌落", "坍塌",
-            "杀人", "犯罪", "被捕", "逮捕", "判刑", "判处", "刑事", "嫌疑人",
-            "车祸", "事故", "失联", "溺水", "坠楼",
-            "社保如何", "公积金如何", "如何办理", "如何领取",
-            "体育", "娱乐", "选秀", "综艺", "明星",
-        ]
-        for pattern in exclude_patterns:
-            if pattern in title:
-                return False
-
-        # Tier 1 — Strong keywords: 1 match = relevant
-        # Industry-specific keywords
-        for keywords in INDUSTRY_KEYWORDS.values():
-            for keyword in keywords:
-                if keyword in text:
-                    return True
-
-        # Strong economy keywords (unambiguously economic)
-        strong_keywords = [
-            "经济", "GDP", "产业", "金融", "财政", "货币", "利率",
-            "投资", "融资", "上市", "IPO", "股价", "债券", "基金",
-            "进出口", "贸易", "关税", "汇率", "外资", "外商",
-            "制造业", "工业增加值", "PMI", "CPI", "PPI",
-            "科创", "独角兽", "营收", "利润", "市值",
-            "房地产", "楼市", "土地出让", "保障房", "住房", "保租房",
-            "减税", "降费", "专项债", "财政赤字",
-        ]
-        for keyword in strong_keywords:
-            if keyword in text:
-                return True
+        if _EXCLUDE_TITLE_MATCHER.contains_any(title):
+            return False
 
-        # Tier 2 — Weak keywords: need 2+ matches
-        weak_keywords = [
-            "发展", "市场", "企业", "公司", "政策", "规划",
-            "创新", "科技", "技术", "数字", "智能", "绿色",
-            "高质量", "改革", "工业", "制造",
-        ]
-        weak_count = sum(1 for keyword in weak_keywords if keyword in text)
-        if weak_count >= 2:
+        # Tier 1 — Strong keywords (industry + economy): 1 match = relevant
+        if _STRONG_KEYWORD_MATCHER.contains_any(text):
             return True
 
-        return False
+        # Tier 2 — Weak keywords: need 2+ matches
+        return len(_WEAK_KEYWORD_MATCHER.find(text)) >= 2
 
     def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
         """Parse date string to datetime."""
@@ -1215,18 +1526,8 @@ class NewsCrawler:
 
         Supports various URL date patterns (tYYYYMMDD, /YYYY-MM-DD/, etc.)
         """
-        patterns = [
-            # tYYYYMMDD_XXXXXXX.html
-            (r't(\d{4})(\d{2})(\d{2})_', lambda m: datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))),
-            # /YYYY-MM-DD/
-            (r'/(\d{4})-(\d{2})-(\d{2})/', lambda m: datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))),
-            # YYYYMMDDHHMMSS as path segment
-            (r'/(\d{4})(\d{2})(\d{2})\d{8,}/', lambda m: datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))),
-            # /YYYYMM/ folder pattern
-            (r'/(\d{4})(\d{2})/', lambda m: datetime(int(m.group(1)), int(m.group(2)), 1)),
-        ]
-        for pattern, builder in patterns:
-            m = re.search(pattern, url)
+        for pattern, builder in _URL_DATE_PATTERNS:
+            m = pattern.search(url)
             if m:
                 try:
                     dt = builder(m)
@@ -1237,81 +1538,127 @@ class NewsCrawler:
         return None
 
     def save_news(self, items: list[dict]) -> int:
-        """Save news items to database, returns count of new items."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        new_count = 0
+        """Save news items to database, returns count of new items.
+
+        All rows go through one executemany in a single writer transaction;
+        INSERT OR IGNORE skips URLs that are already stored. Malformed items
+        are logged and skipped, and if the batch fails the rows are retried
+        one by one so a single bad row does not drop the whole source.
+        """
+        if not items:
+            return 0
 
+        now = datetime.now()
+        rows = []
         for item in items:
             try:
-                # Fallback: extract published_at from URL if not provided
-                published_at = item.get("published_at")
-                if not published_at:
-                    published_at = self._parse_date_from_url(item["original_url"])
-
-                cursor.execute("""
-                    INSERT OR IGNORE INTO news
-                    (source, original_url, original_title, original_content, published_at, collected_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
+                rows.append((
                     item["source"],
                     item["original_url"],
                     item["original_title"],
                     item.get("original_content", ""),
-                    published_at,
-                    datetime.now(),
+                    # Fallback: extract published_at from URL if not provided
+                    item.get("published_at") or self._parse_date_from_url(item["original_url"]),
+                    now,
                 ))
-                if cursor.rowcount > 0:
-                    new_count += 1
             except Exception as e:
                 logger.error(f"Failed to save news: {e}")
 
-        conn.commit()
-        conn.close()
+        if not rows:
+            return 0
+
+        try:
+            with pool.writer() as conn:
+                before = conn.total_changes
+                conn.executemany(INSERT_NEWS_SQL, rows)
+                return conn.total_changes - before
+        except Exception as e:
+            logger.warning(f"Batch insert of {len(rows)} news failed ({e}), retrying row by row")
+
+        # Row-by-row fallback: a failing statement only undoes itself, not the transaction
+        new_count = 0
+        try:
+            with pool.writer() as conn:
+                for row in rows:
+                    try:
+                        before = conn.total_changes
+                        conn.execute(INSERT_NEWS_SQL, row)
+                        new_count += conn.total_changes - before
+                    except Exception as e:
+                        logger.error(f"Failed to save news {row[1]}: {e}")
+        except Exception as e:
+            logger.error(f"Failed to save {len(rows)} news: {e}")
+            return 0
         return new_count
 
-    def crawl_all(self) -> dict:
-        """Crawl all enabled sources."""
-        results = {"total": 0, "new": 0, "sources": {}}
-        sources = get_enabled_sources()
+    def _fetch_source(self, source_key: str, source_info: dict) -> list[dict]:
+        """Collect raw items for one source (RSS or site-specific crawler)."""
+        logger.info(f"Crawling {source_info['name']}...")
 
-        for source_key, source_info in sources.items():
-            logger.info(f"Crawling {source_info['name']}...")
-            items = []
-
-            # Use RSS if available
-            if source_info.get("rss"):
-                items = self.parse_rss(source_info["rss"], source_key)
-            else:
-                # Use specific crawler
-                crawler_method = getattr(self, f"crawl_{source_key}", None)
-                if crawler_method:
-                    items = crawler_method()
-                else:
-                    logger.warning(f"No crawler implemented for {source_key}")
+        # Use RSS if available
+        if source_info.get("rss"):
+            return self.parse_rss(source_info["rss"], source_key)
 
-            # Filter relevant news
-            items = [item for item in items if self.is_relevant_news(item["original_title"])]
+        # Use specific crawler
+        crawler_method = getattr(self, f"crawl_{source_key}", None)
+        if not crawler_method:
+            logger.warning(f"No crawler implemented for {source_key}")
+            return []
+        try:
+            return crawler_method()
+        except Exception as e:
+            logger.error(f"Crawler failed for {source_key}: {e}")
+            return []
 
-            # Remove duplicates by URL
-            seen_urls = set()
-            unique_items = []
-            for item in items:
-                if item["original_url"] not in seen_urls:
-                    seen_urls.add(item["original_url"])
-                    unique_items.append(item)
+    def _crawl_one(self, source_key: str, source_info: dict) -> list[dict]:
+        """Fetch one source and return its relevant items.
 
-            # Save to database
-            new_count = self.save_news(unique_items)
+        Every crawler (and parse_rss) already returns URL-unique items, and
+        save_news' INSERT OR IGNORE covers URLs shared across sources.
+        Runs on a crawl worker thread; does not touch the database.
+        """
+        items = self._fetch_source(source_key, source_info)
 
-            results["sources"][source_key] = {
-                "collected": len(unique_items),
-                "new": new_count,
-            }
-            results["total"] += len(unique_items)
-            results["new"] += new_count
+        # Filter relevant news
+        return [item for item in items if self.is_relevant_news(item["original_title"])]
 
-            logger.info(f"  {source_info['name_ko']}: {len(unique_items)}개 수집, {new_count}개 신규")
+    def crawl_all(self) -> dict:
+        """Crawl all enabled sources.
+
+        Sources are crawled concurrently (CRAWL_MAX_CONCURRENCY workers, sharing
+        the pooled session); each source is saved on the calling thread as soon
+        as its crawl finishes, so DB writes stay serialized.
+        """
+        results = {"total": 0, "new": 0, "sources": {}}
+        sources = get_enabled_sources()
+        collected = {}
+
+        with ThreadPoolExecutor(max_workers=CRAWL_MAX_CONCURRENCY) as executor:
+            futures = {
+                executor.submit(self._crawl_one, source_key, source_info): source_key
+                for source_key, source_info in sources.items()
+            }
+            for future in as_completed(futures):
+                source_key = futures[future]
+                unique_items = future.result()
+
+                # Save to database
+                new_count = self.save_news(unique_items)
+                collected[source_key] = {
+                    "collected": len(unique_items),
+                    "new": new_count,
+                }
+                logger.info(
+                    f"  {sources[source_key]['name_ko']}: "
+                    f"{len(unique_items)}개 수집, {new_count}개 신규"
+                )
+
+        # Report in source order regardless of completion order
+        for source_key in sources:
+            stats = collected[source_key]
+            results["sources"][source_key] = stats
+            results["total"] += stats["collected"]
+            results["new"] += stats["new"]
 
         return results
 
@@ -1,17 +1,41 @@
 """뉴스 선정 및 필터링 모듈 - 출처 다양성 + 품질 기반 선정 + 내용적 점수 + 중복 제거"""
 
+import heapq
 import logging
+import operator
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 import sys
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-from src.collector.content_scorer import ContentScorer
+from src.collector.content_scorer import ContentScorer, _KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
+try:
+    import re2  # Optional: google-re2 (linear-time matching for '.*' patterns)
+except ImportError:
+    re2 = None
+
+
+def _compile_linear(pattern: str):
+    """RE2가 있으면 RE2로, 없거나 RE2가 지원하지 않는 문법이면 re로 컴파일.
+
+    RE2의 숫자 클래스는 ASCII 숫자만 매칭하므로(전각 숫자 불일치) 숫자 패턴에는 쓰지 않는다.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
 
 # ============================================================
 # 제목 유사도 기반 중복 제거
@@ -42,46 +66,55 @@ CORE_TOPIC_KEYWORDS = [
     '特斯拉', '华为', '腾讯', '阿里', '百度', '比亚迪', '宁德时代',
 ]
 
+# 핵심 주제어 조회용 집합 (유사도 계산 시 O(1) 멤버십)
+_CORE_TOPIC_SET = frozenset(CORE_TOPIC_KEYWORDS)
+
 # 중복 판정 임계값 (0.0 ~ 1.0, 높을수록 엄격)
 SIMILARITY_THRESHOLD = 0.4  # 낮춰서 더 많은 중복 감지
 
+# 제목 키워드 추출용 정규식 (모듈 로드 시 1회 컴파일)
+_ENGLISH_WORD_RE = re.compile(r'[A-Za-z]{2,}')
+_NUM_UNIT_RE = re.compile(r'\d+(?:\.\d+)?[亿万兆元%股点个家条项]?')
+_CJK_RUN_RE = re.compile(r'[\u4e00-\u9fff]+')  # 한자 연속 구간 (나머지 문자 제거용)
+
+
+# 키워드 추출 결과 캐시 크기 (처리된 제목 + 한 번에 필터링하는 뉴스 수 여유분)
+TITLE_KEYWORD_CACHE_SIZE = 8192
 
-def extract_title_keywords(title: str) -> set:
+
+@lru_cache(maxsize=TITLE_KEYWORD_CACHE_SIZE)
+def extract_title_keywords(title: str) -> frozenset:
     """제목에서 핵심 키워드 추출 (중복 판정용).
 
     - 핵심 주제어 우선 추출
     - 숫자+단위 패턴 보존 (예: 900亿, 77股, 4100点)
     - 2글자 키워드만 추출 (간결하게)
+
+    같은 제목은 filter_news 호출마다(처리된 제목 로드 등) 반복되므로 결과를 캐시한다.
+    캐시된 값을 공유하므로 불변 집합(frozenset)으로 반환.
     """
     if not title:
-        return set()
-
-    words = set()
+        return frozenset()
 
     # 1. 핵심 주제어 추출 (가장 중요)
-    for keyword in CORE_TOPIC_KEYWORDS:
-        if keyword in title:
-            words.add(keyword)
+    words = {keyword for keyword in CORE_TOPIC_KEYWORDS if keyword in title}
 
     # 2. 영문 단어 추출 (대문자 변환)
-    english_words = re.findall(r'[A-Za-z]{2,}', title)
+    english_words = _ENGLISH_WORD_RE.findall(title)
     words.update(w.upper() for w in english_words)
 
     # 3. 숫자+단위 패턴 추출 (중요한 식별자)
-    num_patterns = re.findall(r'\d+(?:\.\d+)?[亿万兆元%股点个家条项]?', title)
+    num_patterns = _NUM_UNIT_RE.findall(title)
     words.update(p for p in num_patterns if len(p) >= 2)
 
     # 4. 중국어 2글자 키워드 추출 (핵심만)
-    chinese_text = re.sub(r'[^\u4e00-\u9fff]', '', title)
-    for i in range(len(chinese_text) - 1):
-        word = chinese_text[i:i+2]
-        if word not in TITLE_STOPWORDS:
-            words.add(word)
-
-    # stopwords 제거
-    words = {w for w in words if w not in TITLE_STOPWORDS and len(w) >= 2}
+    # 인접 글자 쌍을 map(add)로 한 번에 만든다 (문자열 슬라이스 루프 대신)
+    chinese_text = ''.join(_CJK_RUN_RE.findall(title))
+    words.update(map(operator.add, chinese_text, chinese_text[1:]))
 
-    return words
+    # stopwords 제거 (위 단계들은 모두 2글자 이상만 만든다)
+    words.difference_update(TITLE_STOPWORDS)
+    return frozenset(words)
 
 
 def calculate_title_similarity(title1: str, title2: str) -> float:
@@ -92,9 +125,14 @@ def calculate_title_similarity(title1: str, title2: str) -> float:
     Returns:
         0.0 ~ 1.0 (1.0 = 완전 동일)
     """
-    keywords1 = extract_title_keywords(title1)
-    keywords2 = extract_title_keywords(title2)
+    return calculate_keyword_similarity(
+        extract_title_keywords(title1),
+        extract_title_keywords(title2),
+    )
 
+
+def calculate_keyword_similarity(keywords1: set, keywords2: set) -> float:
+    """미리 추출한 키워드 집합 간 유사도 계산 (calculate_title_similarity와 동일 기준)."""
     if not keywords1 or not keywords2:
         return 0.0
 
@@ -108,7 +146,7 @@ def calculate_title_similarity(title1: str, title2: str) -> float:
     base_sim = len(intersection) / len(union)
 
     # 핵심 주제어 일치 보너스
-    core_matches = sum(1 for kw in intersection if kw in CORE_TOPIC_KEYWORDS or len(kw) >= 3)
+    core_matches = sum(1 for kw in intersection if kw in _CORE_TOPIC_SET or len(kw) >= 3)
     if core_matches >= 2:
         # 핵심 주제어 2개 이상 일치 시 유사도 증가
         base_sim = min(base_sim * 1.5, 1.0)
@@ -118,24 +156,126 @@ def calculate_title_similarity(title1: str, title2: str) -> float:
     return base_sim
 
 
-def is_duplicate_title(title: str, existing_titles: list, threshold: float = SIMILARITY_THRESHOLD) -> tuple:
+def is_duplicate_title(title: str, existing_titles: list, threshold: float = SIMILARITY_THRESHOLD,
+                       existing_keywords: list = None) -> tuple:
     """기존 제목들과 중복 여부 판정.
 
     Args:
         title: 검사할 제목
         existing_titles: 기존 제목 리스트
         threshold: 유사도 임계값
+        existing_keywords: existing_titles와 같은 순서로 미리 추출한 키워드 집합
+            (지정 시 기존 제목의 키워드를 매번 다시 추출하지 않음)
 
     Returns:
         (is_duplicate, matched_title, similarity)
     """
-    for existing in existing_titles:
-        similarity = calculate_title_similarity(title, existing)
+    keywords = extract_title_keywords(title)
+    if not keywords:
+        return (False, None, 0.0)
+
+    if existing_keywords is None:
+        existing_keywords = map(extract_title_keywords, existing_titles)
+
+    for existing, existing_kw in zip(existing_titles, existing_keywords):
+        similarity = calculate_keyword_similarity(keywords, existing_kw)
         if similarity >= threshold:
             return (True, existing, similarity)
     return (False, None, 0.0)
 
 
+def _is_core_keyword(keyword: str) -> bool:
+    """유사도 보너스 대상 키워드 (핵심 주제어 또는 3글자 이상)."""
+    return keyword in _CORE_TOPIC_SET or len(keyword) >= 3
+
+
+class TitleIndex:
+    """중복 판정용 제목 키워드 역색인 (is_duplicate_title의 빠른 버전).
+
+    키워드 → 제목 번호 목록(posting)을 유지해, 후보 제목과 키워드를 하나라도 공유하는
+    제목만 비교한다 (공유 키워드가 없으면 유사도 0). 후보들의 교집합/핵심어 일치 개수는
+    posting을 이어 붙인 배열에서 NumPy로 한 번에 센다. 판정 기준과 결과(처음 임계값을
+    넘는 제목)는 calculate_keyword_similarity 순회와 같다.
+    """
+
+    def __init__(self, titles=(), keywords=None):
+        self.titles = []
+        self.keywords = []
+        self._postings = defaultdict(list)
+        self._sizes = np.empty(64, dtype=np.int64)
+
+        if keywords is None:
+            keywords = map(extract_title_keywords, titles)
+        for title, title_keywords in zip(titles, keywords):
+            self.add(title, title_keywords)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def add(self, title: str, keywords: set):
+        """제목과 그 키워드 집합을 인덱스 끝에 추가."""
+        row = len(self.titles)
+        for kw in keywords:
+            self._postings[kw].append(row)
+        if row >= len(self._sizes):
+            self._sizes = np.resize(self._sizes, 2 * len(self._sizes))
+        self._sizes[row] = len(keywords)
+        self.titles.append(title)
+        self.keywords.append(keywords)
+
+    def find_duplicate(self, keywords: set, threshold: float = SIMILARITY_THRESHOLD) -> tuple:
+        """키워드 집합이 인덱스의 제목과 중복인지 판정.
+
+        Returns:
+            (is_duplicate, matched_title, similarity) — is_duplicate_title과 동일
+        """
+        if not keywords or not self.titles:
+            return (False, None, 0.0)
+        if threshold <= 0:
+            # 유사도는 항상 0 이상 → 첫 제목이 곧 중복
+            return (True, self.titles[0], calculate_keyword_similarity(keywords, self.keywords[0]))
+
+        postings = self._postings
+        shared = [kw for kw in keywords if kw in postings]
+        if not shared:
+            return (False, None, 0.0)
+
+        hit_rows = np.fromiter(chain.from_iterable(postings[kw] for kw in shared), dtype=np.int64)
+        rows, intersection = np.unique(hit_rows, return_counts=True)
+        core_rows = [row for kw in shared if _is_core_keyword(kw) for row in postings[kw]]
+        core_matches = np.bincount(np.searchsorted(rows, core_rows), minlength=len(rows))
+
+        similarity = intersection / (len(keywords) + self._sizes[rows] - intersection)
+        similarity = np.where(
+            core_matches >= 2, np.minimum(similarity * 1.5, 1.0),
+            np.where(core_matches >= 1, np.minimum(similarity * 1.2, 1.0), similarity),
+        )
+
+        matches = np.flatnonzero(similarity >= threshold)
+        if not matches.size:
+            return (False, None, 0.0)
+        row = rows[matches[0]]
+        return (True, self.titles[row], calculate_keyword_similarity(keywords, self.keywords[row]))
+
+
+# 중복 제거 대상 제목: (구분, 제목)
+PROCESSED_TITLES_SQL = """
+    -- 1. 스킵된 뉴스 제목
+    SELECT 'skipped', original_title FROM news
+    WHERE expert_review_status = 'skipped'
+    UNION ALL
+    -- 2. 폐기된 뉴스 제목 (expert_reviews.publish_status = 'discarded')
+    SELECT 'discarded', n.original_title FROM news n
+    JOIN expert_reviews er ON n.id = er.news_id
+    WHERE er.publish_status IN ('discarded', 'rejected')
+    UNION ALL
+    -- 3. 리뷰 완료된 뉴스 제목 (published, draft 포함)
+    SELECT 'reviewed', n.original_title FROM news n
+    JOIN expert_reviews er ON n.id = er.news_id
+    WHERE er.publish_status IN ('published', 'draft')
+"""
+
+
 def load_processed_titles() -> list:
     """DB에서 처리된 뉴스 제목 로드 (스킵/폐기/리뷰완료).
 
@@ -143,37 +283,15 @@ def load_processed_titles() -> list:
         중복 제거 대상 제목 리스트
     """
     try:
-        from src.database.models import get_connection
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        # 1. 스킵된 뉴스 제목
-        cursor.execute("""
-            SELECT original_title FROM news
-            WHERE expert_review_status = 'skipped'
-        """)
-        skipped = [row['original_title'] for row in cursor.fetchall()]
-
-        # 2. 폐기된 뉴스 제목 (expert_reviews.publish_status = 'discarded')
-        cursor.execute("""
-            SELECT n.original_title FROM news n
-            JOIN expert_reviews er ON n.id = er.news_id
-            WHERE er.publish_status IN ('discarded', 'rejected')
-        """)
-        discarded = [row['original_title'] for row in cursor.fetchall()]
-
-        # 3. 리뷰 완료된 뉴스 제목 (published, draft 포함)
-        cursor.execute("""
-            SELECT n.original_title FROM news n
-            JOIN expert_reviews er ON n.id = er.news_id
-            WHERE er.publish_status IN ('published', 'draft')
-        """)
-        reviewed = [row['original_title'] for row in cursor.fetchall()]
-
-        conn.close()
-
-        all_titles = skipped + discarded + reviewed
-        logger.info(f"중복 제거 대상 로드: 스킵 {len(skipped)}, 폐기 {len(discarded)}, 리뷰완료 {len(reviewed)}")
+        from src.database.models import pool
+
+        # 스킵 / 폐기 / 리뷰완료 제목을 쿼리 한 번으로 (순서 유지: 스킵 → 폐기 → 리뷰완료)
+        with pool.reader() as conn:
+            rows = conn.execute(PROCESSED_TITLES_SQL).fetchall()
+
+        all_titles = [row[1] for row in rows]
+        counts = Counter(row[0] for row in rows)
+        logger.info(f"중복 제거 대상 로드: 스킵 {counts['skipped']}, 폐기 {counts['discarded']}, 리뷰완료 {counts['reviewed']}")
 
         return all_titles
 
@@ -199,9 +317,16 @@ GOVERNMENT_ADMIN_KEYWORDS = [
 BRIEF_NEWS_PATTERNS = [
     r'现代汽车.*计划', r'丰田.*计划', r'本田.*计划',  # 외국 자동차 기업 단신
     r'(现代|丰田|本田|日产|大众|通用|福特).*投资.*[万亿韩元|美元|欧元]',
-    r'.*：对公司.*产品售价.*调整',  # 기업 가격 조정 공지
-    r'.*拟.*收购.*深交所问询',  # 단순 거래소 문의
+    r'：对公司.*产品售价.*调整',  # 기업 가격 조정 공지
+    r'拟.*收购.*深交所问询',  # 단순 거래소 문의
 ]
+# search()로만 쓰므로 패턴 앞에 '.*'를 붙이지 않는다 (결과는 같고 줄마다 역추적만 늘어남)
+
+# 패턴 목록은 설정값 그대로 두고, 판정에는 미리 컴파일한 객체를 사용
+_DATA_RES = [re.compile(p) for p in DATA_PATTERNS]
+# 전체 패턴을 하나의 alternation으로 묶어 본문을 한 번만 훑는다 (존재 여부 판정용)
+_DATA_ANY_RE = re.compile('|'.join(f'(?:{p})' for p in DATA_PATTERNS))
+_BRIEF_NEWS_RE = _compile_linear('|'.join(f'(?:{p})' for p in BRIEF_NEWS_PATTERNS))
 
 # 지방정부 출처
 LOCAL_GOV_SOURCES = ['beijing_gov', 'shanghai_gov', 'shenzhen_gov', 'bbtnews', 'sznews']
@@ -277,30 +402,88 @@ DEEP_ANALYSIS_KEYWORDS = [
     '背后', '原因', '影响', '趋势', '展望'
 ]
 
+# 국내/해외 판단 키워드
+FOREIGN_KEYWORDS = ['美国', '欧洲', '日本', '韩国', '东南亚', '国际']
+DOMESTIC_KEYWORDS = ['中国', '国内', '本土', '央行', '发改委', '工信部']
+
+# 키워드 목록별 집합 (본문 매칭 결과와 교집합으로 개수 계산)
+_EXCLUDED_SET = frozenset(EXCLUDED_KEYWORDS)
+_GOVERNMENT_ADMIN_SET = frozenset(GOVERNMENT_ADMIN_KEYWORDS)
+_CONCRETE_SET = frozenset(CONCRETE_KEYWORDS)
+_FACT_RICH_SET = frozenset(FACT_RICH_KEYWORDS)
+_BROAD_SCOPE_SET = frozenset(BROAD_SCOPE_KEYWORDS)
+_DEEP_ANALYSIS_SET = frozenset(DEEP_ANALYSIS_KEYWORDS)
+_FOREIGN_SET = frozenset(FOREIGN_KEYWORDS)
+_DOMESTIC_SET = frozenset(DOMESTIC_KEYWORDS)
+
+
+def _keyword_categories(categories: dict) -> dict:
+    """카테고리 사전을 키워드 → 카테고리 번호 튜플로 뒤집는다 (번호는 사전 순서)."""
+    index = defaultdict(list)
+    for idx, keywords in enumerate(categories.values()):
+        for kw in dict.fromkeys(keywords):
+            index[kw].append(idx)
+    return {kw: tuple(idxs) for kw, idxs in index.items()}
+
+
+# 매칭된 키워드만 훑어 카테고리별 개수를 센다
+_CATEGORY_NAMES = tuple(CATEGORIES)
+_KEYWORD_CATEGORIES = _keyword_categories(CATEGORIES)
+
+# 필터 키워드 전체를 하나로 합친 매처: 뉴스 1건당 본문 스캔 1회
+# (각 판정은 자기 목록과의 교집합만 보므로 결과 집합을 공유해도 판정은 동일)
+_FILTER_KEYWORD_MATCHER = _KeywordMatcher(
+    EXCLUDED_KEYWORDS + GOVERNMENT_ADMIN_KEYWORDS + CONCRETE_KEYWORDS
+    + FACT_RICH_KEYWORDS + BROAD_SCOPE_KEYWORDS + DEEP_ANALYSIS_KEYWORDS
+    + FOREIGN_KEYWORDS + DOMESTIC_KEYWORDS
+    + [kw for keywords in CATEGORIES.values() for kw in keywords]
+)
+
+
+def find_filter_keywords(title: str, content: str, combined: str = None) -> set:
+    """제목+본문에 등장하는 필터 키워드 집합 (아래 판정 함수들의 found 인자로 재사용).
+
+    combined: filter_news가 한 번 만든 title + content. 아래 판정 함수들도 같은
+    인자를 받으며, 없으면 함수마다 새로 이어 붙인다.
+    """
+    if combined is None:
+        combined = title + content
+    return _FILTER_KEYWORD_MATCHER.find(combined)
 
-def is_brief_news(title: str, content: str) -> bool:
+
+def is_brief_news(title: str, content: str, combined: str = None) -> bool:
     """단신 뉴스 여부 판단"""
-    combined = title + content
-    for pattern in BRIEF_NEWS_PATTERNS:
-        if re.search(pattern, combined):
-            return True
     # 제목이 너무 짧고 내용도 짧으면 단신
     if len(title) < 20 and len(content) < 100:
         return True
+    if combined is None:
+        combined = title + content
+    if _BRIEF_NEWS_RE.search(combined):
+        return True
     return False
 
 
-def calculate_fact_richness(title: str, content: str) -> int:
-    """사실 풍부도 점수 계산 (-10 ~ +20)"""
-    combined = title + content
+def calculate_fact_richness(title: str, content: str, found: set = None,
+                            combined: str = None) -> int:
+    """사실 풍부도 점수 계산 (-10 ~ +20)
+
+    found: find_filter_keywords()로 미리 구한 키워드 집합 (없으면 새로 스캔)
+    """
+    if combined is None:
+        combined = title + content
     score = 0
 
-    # 데이터 패턴 개수 (각 +3점)
-    data_count = sum(1 for p in DATA_PATTERNS if re.search(p, combined))
+    # 데이터 패턴 개수 (각 +3점) — 하나도 없으면 패턴별 검사 생략
+    # (패턴끼리 겹치므로 개수는 alternation 한 번으로 셀 수 없다: '1.5%'는 두 패턴 모두 해당)
+    data_count = 0
+    if _DATA_ANY_RE.search(combined):
+        data_count = sum(1 for p in _DATA_RES if p.search(combined))
     score += min(data_count * 3, 12)  # 최대 12점
 
     # 사실 풍부 키워드 (각 +2점)
-    fact_count = sum(1 for kw in FACT_RICH_KEYWORDS if kw in combined)
+    if found is None:
+        found = _FILTER_KEYWORD_MATCHER.find(combined)
+    fact_count = len(found & _FACT_RICH_SET)
     score += min(fact_count * 2, 8)  # 최대 8점
 
     # 내용 길이 보너스
@@ -318,16 +501,17 @@ def calculate_fact_richness(title: str, content: str) -> int:
     return score
 
 
-def calculate_scope_score(title: str, content: str) -> tuple:
+def calculate_scope_score(title: str, content: str, found: set = None) -> tuple:
     """범위 점수 계산 (넓은 뉴스 vs 심층 뉴스)
     Returns: (scope_score, is_broad)
     - scope_score: 정렬용 점수 (넓은 뉴스가 높음)
     - is_broad: True면 넓은 뉴스, False면 심층 뉴스
     """
-    combined = title + content
+    if found is None:
+        found = find_filter_keywords(title, content)
 
-    broad_count = sum(1 for kw in BROAD_SCOPE_KEYWORDS if kw in combined)
-    deep_count = sum(1 for kw in DEEP_ANALYSIS_KEYWORDS if kw in combined)
+    broad_count = len(found & _BROAD_SCOPE_SET)
+    deep_count = len(found & _DEEP_ANALYSIS_SET)
 
     # 넓은 뉴스면 높은 점수, 심층 뉴스면 낮은 점수 (정렬 시 넓은 것이 앞으로)
     if broad_count > deep_count:
@@ -338,50 +522,56 @@ def calculate_scope_score(title: str, content: str) -> tuple:
         return (7, True)  # 중립
 
 
-def is_factual_news(title: str, content: str, source: str = "") -> bool:
+def is_factual_news(title: str, content: str, source: str = "", found: set = None) -> bool:
     """사실 뉴스인지 판단.
 
     중앙정부 출처(CENTRAL_GOV_SOURCES)는 행정 키워드 필터를 면제한다.
     정책 발표문이 '关于印发', '办公厅关于' 등의 패턴으로 필터링되는 것을 방지.
     """
-    combined = title + content
+    if found is None:
+        found = find_filter_keywords(title, content)
 
     # 논설/칼럼 제외 (모든 출처 동일)
-    if any(kw in combined for kw in EXCLUDED_KEYWORDS):
+    if not found.isdisjoint(_EXCLUDED_SET):
         return False
 
     # 정부 행정 공지 제외 — 중앙정부 출처는 면제
     if source not in CENTRAL_GOV_SOURCES:
-        if any(kw in combined for kw in GOVERNMENT_ADMIN_KEYWORDS):
+        if not found.isdisjoint(_GOVERNMENT_ADMIN_SET):
             return False
 
     return True
 
 
-def has_analytical_value(title: str, content: str, source: str = "") -> bool:
+def has_analytical_value(title: str, content: str, source: str = "", found: set = None,
+                         combined: str = None) -> bool:
     """분석 가치 판단.
 
     중앙정부 출처는 '印发+办公' 통지문 필터를 면제한다.
     """
-    combined = title + content
+    if combined is None:
+        combined = title + content
 
     # 정부 단순 통지문 제외 — 중앙정부 출처는 면제
     if source not in CENTRAL_GOV_SOURCES:
         if '印发' in title and '办公' in title:
             return False
 
-    if any(re.search(p, combined) for p in DATA_PATTERNS):
+    if _DATA_ANY_RE.search(combined):
         return True
-    if sum(1 for kw in CONCRETE_KEYWORDS if kw in combined) >= 2:
+    if found is None:
+        found = _FILTER_KEYWORD_MATCHER.find(combined)
+    if len(found & _CONCRETE_SET) >= 2:
         return True
     return len(title) > 15
 
 
-def is_domestic_news(title: str, content: str) -> bool:
+def is_domestic_news(title: str, content: str, found: set = None) -> bool:
     """중국 국내 뉴스 판단"""
-    combined = title + content
-    foreign = sum(1 for kw in ['美国', '欧洲', '日本', '韩国', '东南亚', '国际'] if kw in combined)
-    domestic = sum(1 for kw in ['中国', '国内', '本土', '央行', '发改委', '工信部'] if kw in combined)
+    if found is None:
+        found = find_filter_keywords(title, content)
+    foreign = len(found & _FOREIGN_SET)
+    domestic = len(found & _DOMESTIC_SET)
     return domestic > foreign or foreign <= 1
 
 
@@ -390,13 +580,18 @@ def is_local_gov_source(source: str) -> bool:
     return source in LOCAL_GOV_SOURCES
 
 
-def categorize_news(title: str, content: str) -> str:
+def categorize_news(title: str, content: str, found: set = None) -> str:
     """카테고리 분류"""
-    combined = title + content
-    scores = defaultdict(int)
-    for category, keywords in CATEGORIES.items():
-        scores[category] = sum(1 for kw in keywords if kw in combined)
-    return max(scores.items(), key=lambda x: x[1])[0] if scores else '기타'
+    if found is None:
+        found = find_filter_keywords(title, content)
+    if not _CATEGORY_NAMES:
+        return '기타'
+    scores = [0] * len(_CATEGORY_NAMES)
+    for kw in found:
+        for idx in _KEYWORD_CATEGORIES.get(kw, ()):
+            scores[idx] += 1
+    # 동점이면 CATEGORIES 순서상 앞 카테고리
+    return _CATEGORY_NAMES[max(range(len(scores)), key=scores.__getitem__)]
 
 
 def filter_news(news_list: list, enable_dedup: bool = True) -> list:
@@ -410,12 +605,10 @@ def filter_news(news_list: list, enable_dedup: bool = True) -> list:
 
     # 중복 제거를 위한 기존 제목 로드
     if enable_dedup:
-        processed_titles = load_processed_titles()
-        batch_titles = []  # 현재 배치 내 선정된 제목 (배치 내 중복 방지)
+        # 기존 제목 키워드는 후보마다 다시 추출하지 않도록 인덱스 생성 시 한 번만 계산
+        processed_index = TitleIndex(load_processed_titles())
+        batch_index = TitleIndex()  # 현재 배치 내 선정된 제목 (배치 내 중복 방지)
         dedup_count = 0
-    else:
-        processed_titles = []
-        batch_titles = []
 
     for news in news_list:
         title = news.get('original_title', '')
@@ -423,47 +616,54 @@ def filter_news(news_list: list, enable_dedup: bool = True) -> list:
         source = news.get('source', '')
 
         # 원문 본문이 없는 뉴스는 사용자에게 전달 불가 → 선정 제외
-        if not content.strip():
+        # (isspace()는 strip()과 달리 본문 크기의 사본을 만들지 않는다)
+        if not content or content.isspace():
             continue
 
-        if not is_factual_news(title, content, source):
+        # 제목+본문 연결과 필터 키워드 스캔은 한 번만 하고 아래 판정들이 공유
+        combined = title + content
+        found = find_filter_keywords(title, content, combined)
+
+        if not is_factual_news(title, content, source, found):
             continue
-        if not has_analytical_value(title, content, source):
+        if not has_analytical_value(title, content, source, found, combined):
             continue
 
         # 단신 뉴스 제외
-        if is_brief_news(title, content):
+        if is_brief_news(title, content, combined):
             continue
 
         # === 중복 제거 ===
         if enable_dedup:
+            title_keywords = extract_title_keywords(title)
+
             # 1. 기존 처리된 뉴스와 중복 체크 (스킵/폐기/리뷰완료)
-            is_dup, matched, sim = is_duplicate_title(title, processed_titles)
+            is_dup, matched, sim = processed_index.find_duplicate(title_keywords)
             if is_dup:
                 logger.info(f"중복 제외 (기존): [{news.get('id')}] {title[:30]}... ↔ {matched[:30]}... ({sim:.2f})")
                 dedup_count += 1
                 continue
 
             # 2. 현재 배치 내 중복 체크
-            is_dup, matched, sim = is_duplicate_title(title, batch_titles)
+            is_dup, matched, sim = batch_index.find_duplicate(title_keywords)
             if is_dup:
                 logger.info(f"중복 제외 (배치): [{news.get('id')}] {title[:30]}... ↔ {matched[:30]}... ({sim:.2f})")
                 dedup_count += 1
                 continue
 
             # 배치에 현재 제목 추가
-            batch_titles.append(title)
+            batch_index.add(title, title_keywords)
 
-        news['category'] = categorize_news(title, content)
-        news['is_domestic'] = is_domestic_news(title, content)
+        news['category'] = categorize_news(title, content, found)
+        news['is_domestic'] = is_domestic_news(title, content, found)
         news['is_local_gov'] = is_local_gov_source(source)
 
         # 사실 풍부도 점수
-        fact_score = calculate_fact_richness(title, content)
+        fact_score = calculate_fact_richness(title, content, found, combined)
         news['fact_richness'] = fact_score
 
         # 범위 점수 (넓은 vs 심층)
-        scope_score, is_broad = calculate_scope_score(title, content)
+        scope_score, is_broad = calculate_scope_score(title, content, found)
         news['scope_score'] = scope_score
         news['is_broad'] = is_broad
 
@@ -508,6 +708,11 @@ def _exceeds_source_cap(source: str, current_count: int) -> bool:
     return False
 
 
+def _priority_key(news: dict) -> tuple:
+    """선정 정렬 키 (우선순위 점수, 발행 시각)."""
+    return (news.get('priority_score', 0), news.get('published_at', ''))
+
+
 def balance_categories(news_list: list, target_count: int = 10, max_local_gov: int = 1) -> list:
     """카테고리 + 출처 균형 선정 (지방정부 제한, 출처별 상한, 중요도순 정렬)"""
     by_category = defaultdict(list)
@@ -520,10 +725,7 @@ def balance_categories(news_list: list, target_count: int = 10, max_local_gov: i
 
     # 카테고리별 정렬 (우선순위 점수 기준)
     for cat in by_category:
-        by_category[cat].sort(
-            key=lambda x: (x.get('priority_score', 0), x.get('published_at', '')),
-            reverse=True
-        )
+        by_category[cat].sort(key=_priority_key, reverse=True)
 
     selected = []
     main_categories = ['과학기술', '산업', '에너지', '기업', '금융', '정책', '거시경제']
@@ -531,7 +733,7 @@ def balance_categories(news_list: list, target_count: int = 10, max_local_gov: i
     # 1단계: 각 카테고리에서 1개씩 (출처 중복 최소화, 지방정부 제한)
     for category in main_categories:
         if by_category[category]:
-            for news in by_category[category]:
+            for idx, news in enumerate(by_category[category]):
                 source = news.get('source', '')
                 is_local = news.get('is_local_gov', False)
 
@@ -549,7 +751,8 @@ def balance_categories(news_list: list, target_count: int = 10, max_local_gov: i
                     by_source[source] = by_source.get(source, 0) + 1
                     if is_local:
                         local_gov_count += 1
-                    by_category[category].remove(news)
+                    # 위치로 제거 (remove()는 앞 원소들과 dict 동등 비교를 반복)
+                    by_category[category].pop(idx)
                     break
 
             if len(selected) >= target_count:
@@ -557,14 +760,9 @@ def balance_categories(news_list: list, target_count: int = 10, max_local_gov: i
 
     # 2단계: 남은 슬롯 채우기 (출처 다양성 유지, 지방정부 제한)
     if len(selected) < target_count:
-        remaining = []
-        for cat_news in by_category.values():
-            remaining.extend(cat_news)
-
-        remaining.sort(
-            key=lambda x: (x.get('priority_score', 0), x.get('published_at', '')),
-            reverse=True
-        )
+        # 카테고리별 목록은 이미 정렬돼 있으므로 전체를 다시 정렬하지 않고 병합하며
+        # 필요한 만큼만 꺼낸다 (동점 순서도 이어 붙여 정렬한 결과와 같음)
+        remaining = heapq.merge(*by_category.values(), key=_priority_key, reverse=True)
 
         for news in remaining:
             if len(selected) >= target_count:
@@ -1,4 +1,4 @@
 """Database module."""
-from .models import init_db, get_connection
+from .models import init_db, get_connection, tune_connection, ConnectionPool, pool
 
-__all__ = ["init_db", "get_connection"]
+__all__ = ["init_db", "get_connection", "tune_connection", "ConnectionPool", "pool"]
@@ -1,6 +1,10 @@
 """Database models and initialization."""
 
+import os
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 import sys
 
@@ -8,13 +12,101 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 from config.settings import DATABASE_PATH
 
 
+# Per-connection tuning. journal_mode=WAL is a property of each database file, so
+# tune_connection requests it on every connection (a no-op once the file is in WAL)
+CONNECTION_PRAGMAS = (
+    "synchronous=NORMAL",
+    "busy_timeout=5000",      # wait up to 5s for a writer instead of failing with SQLITE_BUSY
+    "cache_size=-65536",      # 64 MB page cache
+    "temp_store=MEMORY",
+    "mmap_size=268435456",    # 256 MB
+)
+
+
 def get_connection() -> sqlite3.Connection:
-    """Get database connection."""
+    """Get database connection (WAL mode, tuned PRAGMAs)."""
     conn = sqlite3.connect(DATABASE_PATH)
     conn.row_factory = sqlite3.Row
+    return tune_connection(conn)
+
+
+def tune_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Enable WAL and apply CONNECTION_PRAGMAS to a connection."""
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
+    # After busy_timeout, so the first switch of a file waits out other connections
+    conn.execute("PRAGMA journal_mode=WAL")
     return conn
 
 
+class ConnectionPool:
+    """Process-wide SQLite pool: one serialized writer + several readers.
+
+    WAL mode lets readers run alongside the single writer, so read-heavy
+    callers (public feed) reuse open connections instead of connecting per call.
+
+    Usage:
+        with pool.reader() as conn:
+            conn.execute("SELECT ...")
+
+        with pool.writer() as conn:   # BEGIN IMMEDIATE ... COMMIT
+            conn.execute("UPDATE ...")
+    """
+
+    def __init__(self, database: str = DATABASE_PATH, max_readers: int = None):
+        self.database = database
+        self.max_readers = max_readers or max(os.cpu_count() or 1, 4)
+        self._readers = queue.Queue()
+        self._reader_count = 0
+        self._reader_count_lock = threading.Lock()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections move between threads, but the pool hands each one to a single user at a time
+        conn = sqlite3.connect(self.database, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return tune_connection(conn)
+
+    @contextmanager
+    def reader(self):
+        """Borrow a read connection (opened lazily up to max_readers)."""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._reader_count_lock:
+                can_open = self._reader_count < self.max_readers
+                if can_open:
+                    self._reader_count += 1
+            conn = self._connect() if can_open else self._readers.get()
+
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    @contextmanager
+    def writer(self):
+        """Borrow the writer connection inside a BEGIN IMMEDIATE transaction."""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = self._connect()
+
+            conn = self._writer
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+
+
+# Shared pool for this process (connections are opened on first use)
+pool = ConnectionPool()
+
+
 def init_db():
     """Initialize database with schema."""
     conn = get_connection()
@@ -46,7 +138,8 @@ def init_db():
             market_relevance_score REAL,
             uncertainty_score REAL,
             expert_explainability_score REAL,
-            topic_vector TEXT,
+            topic_vector BLOB,
+            content_hash TEXT,
             content_score REAL,
             score_breakdown TEXT,
             score_explanation TEXT,
@@ -121,6 +214,18 @@ def init_db():
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_reviews_completed ON expert_reviews(review_completed_at DESC)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_reviews_publish_status ON expert_reviews(publish_status)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_content_score ON news(content_score DESC)")
+    # Daily selection: status filter + 24h published_at range (daily_news_selector)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_selection ON news(expert_review_status, published_at DESC)")
+    # Public feed (src/api/public_feed.py): published reviews join + date filters
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_reviews_published ON expert_reviews(news_id)
+        WHERE expert_comment IS NOT NULL AND publish_status = 'published'
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_reviews_published_date ON expert_reviews(DATE(created_at))
+        WHERE expert_comment IS NOT NULL AND publish_status = 'published'
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_date_importance ON news(DATE(published_at), importance_score DESC)")
 
     conn.commit()
     conn.close()
@@ -162,9 +267,13 @@ def migrate_db():
         print("Added expert_explainability_score column to news table")
 
     if 'topic_vector' not in columns:
-        cursor.execute("ALTER TABLE news ADD COLUMN topic_vector TEXT")
+        cursor.execute("ALTER TABLE news ADD COLUMN topic_vector BLOB")
         print("Added topic_vector column to news table")
 
+    if 'content_hash' not in columns:
+        cursor.execute("ALTER TABLE news ADD COLUMN content_hash TEXT")
+        print("Added content_hash column to news table")
+
     # Content-Based Scoring 컬럼
     if 'content_score' not in columns:
         cursor.execute("ALTER TABLE news ADD COLUMN content_score REAL")
@@ -239,6 +348,17 @@ def migrate_db():
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_notifications_read ON notifications(is_read)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_notifications_created ON notifications(created_at DESC)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_expert_review_status ON news(expert_review_status)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_selection ON news(expert_review_status, published_at DESC)")
+    # Public feed (src/api/public_feed.py): published reviews join + date filters
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_reviews_published ON expert_reviews(news_id)
+        WHERE expert_comment IS NOT NULL AND publish_status = 'published'
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_reviews_published_date ON expert_reviews(DATE(created_at))
+        WHERE expert_comment IS NOT NULL AND publish_status = 'published'
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_date_importance ON news(DATE(published_at), importance_score DESC)")
 
     # Trigger: block expert_reviews insert unless news is queued_today
     cursor.execute("""
@@ -273,6 +393,10 @@ def migrate_db():
         END;
     """)
 
+    conn.commit()
+
+    # Refresh planner statistics so the indexes above are actually chosen
+    cursor.execute("ANALYZE")
     conn.commit()
     conn.close()
     print("Database migration completed.")
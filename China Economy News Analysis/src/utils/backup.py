@@ -3,6 +3,7 @@
 
 import shutil
 import gzip
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 
@@ -12,6 +13,31 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 from config.settings import DATABASE_PATH, BACKUP_PATH
 
 
+def _wal_sidecars(db_path: Path) -> list[Path]:
+    """WAL-mode companion files (-wal, -shm) of a database file."""
+    return [db_path.with_name(db_path.name + suffix) for suffix in ("-wal", "-shm")]
+
+
+def _snapshot_database(db_path: Path, dest_path: Path) -> None:
+    """Copy a consistent snapshot of the database with the SQLite backup API.
+
+    Unlike a file copy of news.db, this includes transactions that are
+    committed but still sitting in the -wal file, and it is safe while
+    other connections are writing.
+    """
+    source = sqlite3.connect(db_path)
+    try:
+        dest = sqlite3.connect(dest_path)
+        try:
+            source.backup(dest)
+            # Self-contained file: no -wal/-shm appear when the backup is opened
+            dest.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            dest.close()
+    finally:
+        source.close()
+
+
 def create_backup(compress: bool = True) -> Path:
     """Create a backup of the database.
 
@@ -31,13 +57,19 @@ def create_backup(compress: bool = True) -> Path:
         backup_filename = f"news_backup_{timestamp}.db.gz"
         backup_path = backup_dir / backup_filename
 
-        with open(db_path, 'rb') as f_in:
-            with gzip.open(backup_path, 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
+        # Snapshot first (outside the news_backup_* pattern), then compress it
+        snapshot_path = backup_dir / f".snapshot_{timestamp}.db"
+        try:
+            _snapshot_database(db_path, snapshot_path)
+            with open(snapshot_path, 'rb') as f_in:
+                with gzip.open(backup_path, 'wb') as f_out:
+                    shutil.copyfileobj(f_in, f_out)
+        finally:
+            snapshot_path.unlink(missing_ok=True)
     else:
         backup_filename = f"news_backup_{timestamp}.db"
         backup_path = backup_dir / backup_filename
-        shutil.copy2(db_path, backup_path)
+        _snapshot_database(db_path, backup_path)
 
     print(f"Backup created: {backup_path}")
     return backup_path
@@ -59,12 +91,17 @@ def restore_backup(backup_path: str) -> bool:
         print(f"Backup file not found: {backup_path}")
         return False
 
-    # Create a backup of current DB before restoring
+    # Create a backup of current DB before restoring (including un-checkpointed WAL data)
     if db_path.exists():
         current_backup = db_path.with_suffix('.db.bak')
-        shutil.copy2(db_path, current_backup)
+        current_backup.unlink(missing_ok=True)
+        _snapshot_database(db_path, current_backup)
         print(f"Current DB backed up to: {current_backup}")
 
+    # A stale -wal/-shm next to the restored file would be replayed on top of it
+    for sidecar in _wal_sidecars(db_path):
+        sidecar.unlink(missing_ok=True)
+
     if backup_file.suffix == '.gz':
         with gzip.open(backup_file, 'rb') as f_in:
             with open(db_path, 'wb') as f_out:
@@ -7,6 +7,7 @@ Translation pipeline:
 """
 
 import logging
+import threading
 import time
 from typing import Optional
 
@@ -14,11 +15,39 @@ from deep_translator import GoogleTranslator
 
 logger = logging.getLogger(__name__)
 
-_translator = GoogleTranslator(source='zh-CN', target='ko')
+# GoogleTranslator.translate() stores the query text on the instance before
+# sending it, so an instance must not be shared between threads
+_thread_local = threading.local()
+
+
+def _get_translator() -> GoogleTranslator:
+    """Return this thread's translator (created on first use)."""
+    translator = getattr(_thread_local, "translator", None)
+    if translator is None:
+        translator = GoogleTranslator(source='zh-CN', target='ko')
+        _thread_local.translator = translator
+    return translator
 
 # Rate limit: minimum seconds between API calls
 _MIN_INTERVAL = 0.3
 _last_call_time = 0.0
+_rate_lock = threading.Lock()
+
+
+def _wait_for_slot() -> None:
+    """Reserve the next API call slot, sleeping until it opens.
+
+    Thread-safe: concurrent callers are spaced _MIN_INTERVAL apart.
+    """
+    global _last_call_time
+
+    with _rate_lock:
+        now = time.time()
+        slot = max(now, _last_call_time + _MIN_INTERVAL)
+        _last_call_time = slot
+
+    if slot > now:
+        time.sleep(slot - now)
 
 
 def _apply_postprocessing(text: str) -> str:
@@ -60,21 +89,16 @@ def translate_zh_to_ko(text: str, max_length: int = 5000, apply_postprocess: boo
     Returns:
         Korean translation, or None on failure.
     """
-    global _last_call_time
-
     if not text or not text.strip():
         return None
 
     text = text.strip()[:max_length]
 
     # Rate limiting
-    elapsed = time.time() - _last_call_time
-    if elapsed < _MIN_INTERVAL:
-        time.sleep(_MIN_INTERVAL - elapsed)
+    _wait_for_slot()
 
     try:
-        result = _translator.translate(text)
-        _last_call_time = time.time()
+        result = _get_translator().translate(text)
 
         # Apply post-processing if enabled
         if result and apply_postprocess:
@@ -83,7 +107,6 @@ def translate_zh_to_ko(text: str, max_length: int = 5000, apply_postprocess: boo
         return result
     except Exception as e:
         logger.warning(f"Translation failed: {e}")
-        _last_call_time = time.time()
         return None
 
 
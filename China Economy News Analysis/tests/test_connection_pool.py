@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Test ConnectionPool reader/writer behaviour on a throwaway database.
+
+Checks commit and rollback of writer transactions, reader connection reuse,
+the max_readers bound, that writer transactions are serialized and that
+every database file the pool opens is switched to WAL.
+"""
+
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.database.models import ConnectionPool
+
+
+def make_pool(tmp_dir: str, max_readers: int = 2) -> ConnectionPool:
+    pool = ConnectionPool(str(Path(tmp_dir) / "pool.db"), max_readers=max_readers)
+    with pool.writer() as conn:
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    return pool
+
+
+def test_writer_commits_and_rolls_back():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pool = make_pool(tmp_dir)
+
+        with pool.writer() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('kept')")
+
+        try:
+            with pool.writer() as conn:
+                conn.execute("INSERT INTO items (name) VALUES ('dropped')")
+                raise RuntimeError("abort transaction")
+        except RuntimeError:
+            pass
+
+        with pool.reader() as conn:
+            names = [row["name"] for row in conn.execute("SELECT name FROM items")]
+        assert names == ["kept"]
+
+        # The writer is usable again after a rollback
+        with pool.writer() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('again')")
+        with pool.reader() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 2
+
+
+def test_readers_are_reused_and_bounded():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pool = make_pool(tmp_dir, max_readers=2)
+
+        with pool.reader() as first:
+            pass
+        with pool.reader() as second:
+            assert second is first
+
+        # With both readers borrowed, a third caller waits for one to return
+        borrowed = threading.Event()
+        got = []
+        with pool.reader() as a, pool.reader() as b:
+            assert a is not b
+
+            def borrow():
+                with pool.reader() as conn:
+                    got.append(conn)
+                borrowed.set()
+
+            thread = threading.Thread(target=borrow)
+            thread.start()
+            assert not borrowed.wait(0.2)
+        thread.join(timeout=5)
+        assert borrowed.is_set() and got[0] in (a, b)
+        assert pool._reader_count == 2
+
+
+def test_writer_transactions_are_serialized():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pool = make_pool(tmp_dir)
+        active = []
+        overlaps = []
+
+        def write(i):
+            with pool.writer() as conn:
+                active.append(i)
+                if len(active) > 1:
+                    overlaps.append(tuple(active))
+                conn.execute("INSERT INTO items (name) VALUES (?)", (f"row{i}",))
+                time.sleep(0.01)
+                active.remove(i)
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert overlaps == []
+        with pool.reader() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 8
+
+        # Committed rows are visible to an independent connection too
+        other = sqlite3.connect(pool.database)
+        assert other.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 8
+        other.close()
+
+
+def test_every_database_uses_wal():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Two files in one process: WAL is per file, not per process
+        for name in ("first.db", "second.db"):
+            pool = ConnectionPool(str(Path(tmp_dir) / name))
+            with pool.writer() as conn:
+                conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+                conn.execute("INSERT INTO items (name) VALUES ('committed')")
+
+            with pool.reader() as conn:
+                assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+            # Readers see the last commit while a write transaction is open
+            with pool.writer() as writer:
+                writer.execute("UPDATE items SET name = 'pending'")
+                with pool.reader() as conn:
+                    assert conn.execute("SELECT name FROM items").fetchone()[0] == "committed"
+
+
+def main():
+    print("=" * 60)
+    print("ConnectionPool")
+    print("=" * 60)
+    for test in (test_writer_commits_and_rolls_back,
+                 test_readers_are_reused_and_bounded,
+                 test_writer_transactions_are_serialized,
+                 test_every_database_uses_wal):
+        test()
+        print(f"  {test.__name__}: PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Test that the crawler's _join_url fast path agrees with urllib's urljoin.
+
+Covers the href shapes the listing pages actually produce plus random hrefs
+built from characters urljoin treats specially (dot segments, query and
+fragment markers, whitespace, backslashes, brackets).
+"""
+
+import random
+import sys
+from pathlib import Path
+from urllib.parse import urljoin
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.collector.crawler import _join_url
+
+PAGE_URLS = [
+    "http://finance.people.com.cn/",
+    "https://www.shanghai.gov.cn",
+    "http://gxj.sz.gov.cn",
+    "https://www.beijing.gov.cn/zhengce/zhengcefagui/index.html",
+    "http://www.stdaily.com",
+    "https://www.cnstock.com/channel/10005",
+    "https://a.example:8080/x/y?q=1#f",
+    "http://user:pw@host/",
+]
+
+# href shapes seen on the crawled listing pages
+CRAWLER_HREFS = [
+    "/n1/2025/0125/c1004-40408123.html",
+    "//finance.people.com.cn/n1/2025/0125/c1004-40408123.html",
+    "./202501/t20250125_123456.html",
+    "../202501/t20250125_123456.html",
+    "t20250125_123456.html",
+    "https://www.example.com/article/1.html",
+    "/nw12344/20250125/abc.html?from=list",
+    "/xwzx/index.html#top",
+    "/",
+    "",
+    "?page=2",
+    "#",
+]
+
+FUZZ_ALPHABET = [
+    "/", "//", ".", "..", "a", "1", "?", "#", ";", "=", "&", "%2F", " ", "\t",
+    "\n", "\\", "中", "-", "_", ":", "@", "x.html", "./", "../", "[", "]", "~",
+]
+
+
+def _join(join, page_url: str, href: str) -> str:
+    """join(page_url, href), with ValueError mapped to its message."""
+    try:
+        return join(page_url, href)
+    except ValueError as e:
+        return f"ValueError: {e}"
+
+
+def test_crawler_href_shapes():
+    for page_url in PAGE_URLS:
+        for href in CRAWLER_HREFS:
+            assert _join(_join_url, page_url, href) == _join(urljoin, page_url, href), (page_url, href)
+
+
+def test_random_hrefs():
+    rng = random.Random(7)
+    mismatches = 0
+    for _ in range(50000):
+        href = "".join(rng.choice(FUZZ_ALPHABET) for _ in range(rng.randint(0, 8)))
+        if rng.random() < 0.6:
+            href = "/" + href
+        if rng.random() < 0.2:
+            href = "/" + href
+        page_url = rng.choice(PAGE_URLS)
+        if _join(_join_url, page_url, href) != _join(urljoin, page_url, href):
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"  MISMATCH {page_url!r} + {href!r}")
+    assert mismatches == 0
+
+
+def main():
+    print("=" * 60)
+    print("_join_url vs urljoin")
+    print("=" * 60)
+    for test in (test_crawler_href_shapes, test_random_hrefs):
+        test()
+        print(f"  {test.__name__}: PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Test request spacing of the API rate limiters under concurrent callers.
+
+- claude_analyzer._RequestRateLimiter: requests-per-minute budget
+- translator._wait_for_slot: _MIN_INTERVAL between translation calls
+
+Each limiter must hand out distinct slots at least one interval apart, no
+matter how many threads ask at once.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.analyzer.claude_analyzer import _RequestRateLimiter
+from src.utils import translator
+
+# Scheduling jitter allowed below the nominal interval (seconds)
+TOLERANCE = 0.01
+
+
+def call_times(wait, callers: int) -> list[float]:
+    """Run wait() from callers threads at once; return sorted return times."""
+    start = threading.Barrier(callers)
+    times = []
+    times_lock = threading.Lock()
+
+    def call():
+        start.wait()
+        wait()
+        with times_lock:
+            times.append(time.monotonic())
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sorted(times)
+
+
+def assert_spaced(times: list[float], interval: float):
+    gaps = [b - a for a, b in zip(times, times[1:])]
+    assert min(gaps) >= interval - TOLERANCE, gaps
+    # Slots are reserved back to back, so the total span is not padded either
+    assert times[-1] - times[0] < interval * (len(times) - 1) + 0.2, gaps
+
+
+def test_request_rate_limiter_spacing():
+    limiter = _RequestRateLimiter(600)  # one request per 0.1s
+    assert abs(limiter.interval - 0.1) < 1e-9
+    assert_spaced(call_times(limiter.wait, 6), limiter.interval)
+
+
+def test_request_rate_limiter_unlimited():
+    limiter = _RequestRateLimiter(0)
+    started = time.monotonic()
+    call_times(limiter.wait, 8)
+    assert time.monotonic() - started < 0.2
+
+
+def test_translator_wait_for_slot_spacing():
+    assert_spaced(call_times(translator._wait_for_slot, 4), translator._MIN_INTERVAL)
+
+
+def main():
+    print("=" * 60)
+    print("Rate limiters")
+    print("=" * 60)
+    for test in (test_request_rate_limiter_spacing,
+                 test_request_rate_limiter_unlimited,
+                 test_translator_wait_for_slot_spacing):
+        test()
+        print(f"  {test.__name__}: PASS")
+
+
+if __name__ == "__main__":
+    main()
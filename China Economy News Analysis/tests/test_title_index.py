@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Test that TitleIndex.find_duplicate matches the pairwise is_duplicate_title scan.
+
+Builds random titles from core topic words, numbers and filler words, then
+checks both implementations return the same (is_duplicate, matched_title,
+similarity) for a range of thresholds, including titles added after the
+index was built.
+"""
+
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.collector.news_filter import (
+    CORE_TOPIC_KEYWORDS,
+    TitleIndex,
+    calculate_title_similarity,
+    extract_title_keywords,
+    is_duplicate_title,
+)
+
+FILLER_WORDS = [
+    "市场", "企业", "发布", "政策", "增长", "下降", "投资", "项目", "数据", "行业",
+    "上涨", "扩大", "推进", "发展", "合作", "创新", "国际", "全国", "公司", "产品",
+]
+NUMBER_WORDS = ["900亿", "77股", "4100点", "3%", "12月", "1.5万亿"]
+THRESHOLDS = [0.0, 0.1, 0.3, 0.4, 0.6, 1.0, 1.1]
+
+
+def random_title(rng: random.Random) -> str:
+    """Random headline-like string of 2-7 words."""
+    vocab = CORE_TOPIC_KEYWORDS + FILLER_WORDS + NUMBER_WORDS
+    return "".join(rng.choice(vocab) for _ in range(rng.randint(2, 7)))
+
+
+def check_index(rng: random.Random, existing: list, queries: int = 40) -> int:
+    """Compare TitleIndex against is_duplicate_title; return mismatch count."""
+    index = TitleIndex(existing)
+    existing = list(existing)
+    mismatches = 0
+
+    for _ in range(queries):
+        title = random_title(rng) if rng.random() < 0.5 else rng.choice(existing or [""])
+        threshold = rng.choice(THRESHOLDS)
+
+        expected = is_duplicate_title(title, existing, threshold)
+        actual = index.find_duplicate(extract_title_keywords(title), threshold)
+        if expected != actual:
+            mismatches += 1
+            print(f"  MISMATCH {title!r} @ {threshold}: {expected} != {actual}")
+
+        # Titles appended later must be found like the initial ones
+        if rng.random() < 0.3:
+            added = random_title(rng)
+            index.add(added, extract_title_keywords(added))
+            existing.append(added)
+
+    return mismatches
+
+
+def test_find_duplicate_matches_pairwise_scan():
+    rng = random.Random(20240125)
+    mismatches = 0
+    for _ in range(150):
+        existing = [random_title(rng) for _ in range(rng.randint(0, 120))]
+        mismatches += check_index(rng, existing)
+    assert mismatches == 0
+
+
+def test_similarity_of_match_is_reported():
+    titles = ["央行降准释放长期资金", "新能源汽车销量增长"]
+    is_dup, matched, similarity = TitleIndex(titles).find_duplicate(
+        extract_title_keywords("央行降准释放长期资金"))
+    assert is_dup and matched == titles[0]
+    assert similarity == calculate_title_similarity("央行降准释放长期资金", titles[0])
+
+
+def test_empty_inputs():
+    assert TitleIndex().find_duplicate(extract_title_keywords("央行降准")) == (False, None, 0.0)
+    assert TitleIndex(["央行降准"]).find_duplicate(frozenset()) == (False, None, 0.0)
+
+
+def main():
+    print("=" * 60)
+    print("TitleIndex vs is_duplicate_title")
+    print("=" * 60)
+    for test in (test_find_duplicate_matches_pairwise_scan,
+                 test_similarity_of_match_is_reported,
+                 test_empty_inputs):
+        test()
+        print(f"  {test.__name__}: PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Test the topic_vector column encoding (pack_vector / unpack_vector).
+
+New rows store float16 BLOBs; rows written before that hold a JSON list of
+floats. Both must decode to float32 arrays equal to the original embedding
+(within float16 precision for BLOBs, exactly for JSON).
+"""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import numpy as np
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.analyzer.embeddings import (
+    TFIDF_DIMENSION,
+    generate_tfidf_vector,
+    pack_vector,
+    unpack_vector,
+)
+
+
+def test_blob_round_trip():
+    rng = np.random.default_rng(0)
+    embedding = rng.normal(size=TFIDF_DIMENSION).astype(np.float32)
+    embedding /= np.linalg.norm(embedding)
+
+    blob = pack_vector(embedding.tolist())
+    assert isinstance(blob, bytes) and len(blob) == 2 * TFIDF_DIMENSION
+
+    decoded = unpack_vector(blob)
+    assert decoded.dtype == np.float32 and decoded.shape == embedding.shape
+    np.testing.assert_allclose(decoded, embedding, rtol=1e-3, atol=1e-4)
+    assert float(decoded @ embedding) > 0.9999
+
+
+def test_blob_round_trip_through_sqlite():
+    embedding = generate_tfidf_vector("央行宣布降准0.5个百分点 释放长期资金约1万亿元")
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE news (id INTEGER PRIMARY KEY, topic_vector TEXT)")
+    conn.execute("INSERT INTO news (topic_vector) VALUES (?)", (pack_vector(embedding),))
+    stored = conn.execute("SELECT topic_vector FROM news").fetchone()[0]
+    conn.close()
+
+    np.testing.assert_allclose(unpack_vector(stored), embedding, rtol=1e-3, atol=1e-4)
+
+
+def test_legacy_json_decode():
+    embedding = [0.5, -0.25, 0.0, 0.125, 1e-3]
+    decoded = unpack_vector(json.dumps(embedding))
+    assert decoded.dtype == np.float32
+    assert decoded.tolist() == np.asarray(embedding, dtype=np.float32).tolist()
+
+
+def test_null_vector():
+    assert unpack_vector(None) is None
+
+
+def main():
+    print("=" * 60)
+    print("topic_vector encoding")
+    print("=" * 60)
+    for test in (test_blob_round_trip,
+                 test_blob_round_trip_through_sqlite,
+                 test_legacy_json_decode,
+                 test_null_vector):
+        test()
+        print(f"  {test.__name__}: PASS")
+
+
+if __name__ == "__main__":
+    main()